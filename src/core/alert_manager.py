@@ -1,11 +1,54 @@
+import bisect
 import logging
-from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass
+import operator
+import os
+from typing import Deque, Dict, List, Optional, Callable, Tuple
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 import json
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+_LOG = logging.getLogger(__name__)
+
+# Alert message templates
+MSG_DISK_CRIT = "Critical: Low disk space - {:.1f}GB remaining"
+MSG_DISK_WARN = "Warning: Low disk space - {:.1f}GB remaining"
+MSG_MEM_CRIT = "Critical: High memory usage - {:.1f}%"
+MSG_MEM_WARN = "Warning: High memory usage - {:.1f}%"
+MSG_CPU_CRIT = "Critical: High CPU usage - {:.1f}%"
+MSG_CPU_WARN = "Warning: High CPU usage - {:.1f}%"
+MSG_TEMP_CRIT = "Critical: High CPU temperature - {:.1f}°C"
+MSG_TEMP_WARN = "Warning: High CPU temperature - {:.1f}°C"
+
+BYTES_TO_GB = 1.0 / 1073741824
+
+# Required keys of a serialized alert, in SystemAlert field order
+_ALERT_FIELDS = operator.itemgetter(
+    'timestamp', 'severity', 'category', 'message',
+    'resource_info', 'acknowledged', 'resolved'
+)
 
 class AlertSeverity(Enum):
     """Alert severity levels"""
@@ -13,7 +56,7 @@ class AlertSeverity(Enum):
     WARNING = "warning"
     CRITICAL = "critical"
 
-@dataclass
+@dataclass(slots=True)
 class SystemAlert:
     """Container for system alerts"""
     timestamp: datetime
@@ -24,245 +67,477 @@ class SystemAlert:
     acknowledged: bool = False
     resolved: bool = False
     resolution_time: Optional[datetime] = None
+    id: Optional[int] = None
+    _timestamp_iso: Optional[str] = field(default=None, repr=False, compare=False)
+    _resolution_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.resolution_time is not None:
+            self._resolution_iso = self.resolution_time.isoformat()
+        
+    def mark_acknowledged(self):
+        """Acknowledge the alert and invalidate its serialized form"""
+        self.acknowledged = True
+        self._cached_dict = None
+        
+    def mark_resolved(self, resolution_time: datetime, resolution_iso: Optional[str] = None):
+        """Resolve the alert and invalidate its serialized form"""
+        self.resolved = True
+        self.resolution_time = resolution_time
+        self._resolution_iso = resolution_iso or resolution_time.isoformat()
+        self._cached_dict = None
+
+_BY_TIMESTAMP = operator.attrgetter('timestamp')
+
+_SEV_CACHE = {severity.value: severity for severity in AlertSeverity}
 
 class AlertManager(QObject):
     """Manages system alerts and notifications"""
     
     # Signals for UI updates
     alert_raised = pyqtSignal(dict)  # New alert
+    alerts_raised_batch = pyqtSignal(list)  # New alerts from one health check
     alert_resolved = pyqtSignal(dict)  # Alert resolved
     alert_status_changed = pyqtSignal(dict)  # Alert status update
     
+    _SEV_TO_LOG = {
+        AlertSeverity.CRITICAL: logging.CRITICAL,
+        AlertSeverity.WARNING: logging.WARNING,
+        AlertSeverity.INFO: logging.INFO
+    }
+    
+    # Alert thresholds
+    DISK_CRIT = 1 << 30  # 1GB
+    DISK_WARN = 5 << 30  # 5GB
+    MEM_CRIT = 95.0  # 95% usage
+    MEM_WARN = 85.0  # 85% usage
+    CPU_CRIT = 95.0  # 95% usage
+    CPU_WARN = 85.0  # 85% usage
+    TEMP_CRIT = 85.0  # 85°C
+    TEMP_WARN = 75.0  # 75°C
+    
+    # Threshold rules: (status key, comparison, critical, warning, category,
+    # critical message, warning message, display scale)
+    _RULES = (
+        ('disk_space', operator.lt, DISK_CRIT, DISK_WARN,
+         'disk_space', MSG_DISK_CRIT, MSG_DISK_WARN, BYTES_TO_GB),
+        ('memory_usage', operator.gt, MEM_CRIT, MEM_WARN,
+         'memory', MSG_MEM_CRIT, MSG_MEM_WARN, 1.0),
+        ('cpu_usage', operator.gt, CPU_CRIT, CPU_WARN,
+         'cpu', MSG_CPU_CRIT, MSG_CPU_WARN, 1.0),
+        ('cpu_temp', operator.gt, TEMP_CRIT, TEMP_WARN,
+         'temperature', MSG_TEMP_CRIT, MSG_TEMP_WARN, 1.0),
+    )
+    
     def __init__(self):
         super().__init__()
-        self.logger = logging.getLogger(__name__)
+        self.logger = _LOG
         self.alerts_dir = Path("data/alerts")
         self.alerts_dir.mkdir(parents=True, exist_ok=True)
         
-        # Active alerts
+        # Active (unresolved) alerts
         self.active_alerts: List[SystemAlert] = []
         
-        # Alert thresholds
-        self.thresholds = {
-            'disk_space_critical': 1024 * 1024 * 1024,  # 1GB
-            'disk_space_warning': 5 * 1024 * 1024 * 1024,  # 5GB
-            'memory_critical': 95.0,  # 95% usage
-            'memory_warning': 85.0,  # 85% usage
-            'cpu_critical': 95.0,  # 95% usage
-            'cpu_warning': 85.0,  # 85% usage
-            'temperature_critical': 85.0,  # 85°C
-            'temperature_warning': 75.0  # 75°C
-        }
+        # Resolved alerts, bounded so long-running sessions don't grow forever
+        self.history: Deque[SystemAlert] = deque(maxlen=1000)
+        
+        # Active and historical alerts ordered by timestamp for windowed queries
+        self._by_time: List[SystemAlert] = []
+        
+        # Unresolved alerts indexed by (category, severity) for duplicate checks
+        self._active_index: Dict[Tuple[str, AlertSeverity], SystemAlert] = {}
+        
+        # Unresolved alerts by stable id
+        self._next_id = 0
+        self._by_id: Dict[int, SystemAlert] = {}
+        
+        # Read-only view of the thresholds for external introspection
+        self.thresholds = MappingProxyType({
+            'disk_space_critical': self.DISK_CRIT,
+            'disk_space_warning': self.DISK_WARN,
+            'memory_critical': self.MEM_CRIT,
+            'memory_warning': self.MEM_WARN,
+            'cpu_critical': self.CPU_CRIT,
+            'cpu_warning': self.CPU_WARN,
+            'temperature_critical': self.TEMP_CRIT,
+            'temperature_warning': self.TEMP_WARN
+        })
+        
+        # Snapshot plus append-only journal of mutations since the snapshot.
+        # Paths are resolved to plain strings once and reused for every open().
+        self._snapshot_file = str(self.alerts_dir / "alerts.json")
+        self._snapshot_tmp = self._snapshot_file + ".tmp"
+        self._journal_file = str(self.alerts_dir / "alerts.jsonl")
+        self._journal_limit = 1024 * 1024  # Compact once the journal exceeds 1MB
+        self._alerts_fh = None
+        self._journal_size = 0
+        
+        # Coalesce bursts of mutations into a single journal write
+        self._pending_records: List[bytes] = []
+        self._dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save)
+        
+        # Timestamp shared by every alert raised/resolved within one health check
+        self._tick_ts: Optional[datetime] = None
+        self._tick_iso: Optional[str] = None
         
         # Load existing alerts
         self._load_alerts()
+        self._open_journal()
         
     def check_system_health(self, health_status: Dict):
         """Check system health and raise alerts if needed"""
+        self._tick_ts = datetime.now()
+        self._tick_iso = self._tick_ts.isoformat()
+        new_alerts: List[Dict] = []
         try:
-            # Check disk space
-            if health_status['disk_space'] < self.thresholds['disk_space_critical']:
-                self.raise_alert(
-                    AlertSeverity.CRITICAL,
-                    "disk_space",
-                    f"Critical: Low disk space - {health_status['disk_space'] / 1024 / 1024 / 1024:.1f}GB remaining",
-                    health_status
-                )
-            elif health_status['disk_space'] < self.thresholds['disk_space_warning']:
-                self.raise_alert(
-                    AlertSeverity.WARNING,
-                    "disk_space",
-                    f"Warning: Low disk space - {health_status['disk_space'] / 1024 / 1024 / 1024:.1f}GB remaining",
-                    health_status
-                )
-                
-            # Check memory usage
-            if health_status['memory_usage'] > self.thresholds['memory_critical']:
-                self.raise_alert(
-                    AlertSeverity.CRITICAL,
-                    "memory",
-                    f"Critical: High memory usage - {health_status['memory_usage']:.1f}%",
-                    health_status
-                )
-            elif health_status['memory_usage'] > self.thresholds['memory_warning']:
-                self.raise_alert(
-                    AlertSeverity.WARNING,
-                    "memory",
-                    f"Warning: High memory usage - {health_status['memory_usage']:.1f}%",
-                    health_status
-                )
-                
-            # Check CPU usage
-            if health_status['cpu_usage'] > self.thresholds['cpu_critical']:
-                self.raise_alert(
-                    AlertSeverity.CRITICAL,
-                    "cpu",
-                    f"Critical: High CPU usage - {health_status['cpu_usage']:.1f}%",
-                    health_status
-                )
-            elif health_status['cpu_usage'] > self.thresholds['cpu_warning']:
-                self.raise_alert(
-                    AlertSeverity.WARNING,
-                    "cpu",
-                    f"Warning: High CPU usage - {health_status['cpu_usage']:.1f}%",
-                    health_status
-                )
-                
-            # Check CPU temperature if available
-            if health_status.get('cpu_temp'):
-                temp = health_status['cpu_temp']
-                if temp > self.thresholds['temperature_critical']:
-                    self.raise_alert(
-                        AlertSeverity.CRITICAL,
-                        "temperature",
-                        f"Critical: High CPU temperature - {temp:.1f}°C",
-                        health_status
-                    )
-                elif temp > self.thresholds['temperature_warning']:
-                    self.raise_alert(
-                        AlertSeverity.WARNING,
-                        "temperature",
-                        f"Warning: High CPU temperature - {temp:.1f}°C",
-                        health_status
-                    )
+            raise_alert = self.raise_alert
+            active_index = self._active_index
+            for key, op, crit, warn, category, fmt_crit, fmt_warn, scale in self._RULES:
+                value = health_status.get(key)
+                if value is None:
+                    continue
+                if op(value, crit):
+                    severity, fmt = AlertSeverity.CRITICAL, fmt_crit
+                elif op(value, warn):
+                    severity, fmt = AlertSeverity.WARNING, fmt_warn
+                else:
+                    continue
+                    
+                # Skip building the message for alerts that are already active
+                if (category, severity) in active_index:
+                    continue
+                raise_alert(severity, category, fmt.format(value * scale),
+                            health_status, batch=new_alerts)
+                    
+            # Emit all new alerts from this check at once
+            if new_alerts:
+                self.alerts_raised_batch.emit(new_alerts)
                     
             # Check for resolved alerts
             self._check_resolved_alerts(health_status)
             
         except Exception as e:
             self.logger.error(f"Error checking system health: {e}")
+        finally:
+            self._tick_ts = None
+            self._tick_iso = None
             
     def raise_alert(self, severity: AlertSeverity, category: str, 
-                   message: str, resource_info: Dict):
-        """Raise a new system alert"""
+                   message: str, resource_info: Dict,
+                   batch: Optional[List[Dict]] = None):
+        """Raise a new system alert
+        
+        When batch is given the alert is collected there instead of being
+        emitted individually through alert_raised.
+        """
         # Check if similar alert already exists
-        for alert in self.active_alerts:
-            if (alert.category == category and 
-                alert.severity == severity and 
-                not alert.resolved):
-                return  # Skip duplicate alert
+        key = (category, severity)
+        if key in self._active_index:
+            return  # Skip duplicate alert
                 
+        if self._tick_ts is not None:
+            timestamp, timestamp_iso = self._tick_ts, self._tick_iso
+        else:
+            timestamp = datetime.now()
+            timestamp_iso = timestamp.isoformat()
+            
         alert = SystemAlert(
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             severity=severity,
             category=category,
             message=message,
-            resource_info=resource_info
+            resource_info=resource_info,
+            id=self._next_id,
+            _timestamp_iso=timestamp_iso
         )
+        self._next_id += 1
         
         self.active_alerts.append(alert)
-        self._save_alerts()
+        self._active_index[key] = alert
+        self._by_id[alert.id] = alert
+        bisect.insort(self._by_time, alert, key=_BY_TIMESTAMP)
+        
+        # The same dict is journaled and emitted, so it is only built once
+        alert_dict = self._alert_to_dict(alert)
+        self._append_record('raise', alert, alert_dict)
         
         # Emit signal for UI update
-        self.alert_raised.emit(self._alert_to_dict(alert))
+        if batch is not None:
+            batch.append(alert_dict)
+        else:
+            self.alert_raised.emit(alert_dict)
         
         # Log alert
-        log_level = logging.CRITICAL if severity == AlertSeverity.CRITICAL else logging.WARNING
-        self.logger.log(log_level, message)
+        log_level = self._SEV_TO_LOG[severity]
+        if _LOG.isEnabledFor(log_level):
+            _LOG.log(log_level, message)
         
     def acknowledge_alert(self, alert_id: int):
         """Acknowledge an alert"""
-        if 0 <= alert_id < len(self.active_alerts):
-            alert = self.active_alerts[alert_id]
-            alert.acknowledged = True
-            self._save_alerts()
-            
-            # Emit signal for UI update
-            self.alert_status_changed.emit(self._alert_to_dict(alert))
+        alert = self._by_id.get(alert_id)
+        if alert is None:
+            return
+        alert.mark_acknowledged()
+        self._append_record('ack', alert)
+        
+        # Emit signal for UI update
+        self.alert_status_changed.emit(self._alert_to_dict(alert))
             
     def resolve_alert(self, alert_id: int):
         """Mark an alert as resolved"""
-        if 0 <= alert_id < len(self.active_alerts):
-            alert = self.active_alerts[alert_id]
-            alert.resolved = True
-            alert.resolution_time = datetime.now()
-            self._save_alerts()
-            
-            # Emit signal for UI update
-            self.alert_resolved.emit(self._alert_to_dict(alert))
+        alert = self._by_id.get(alert_id)
+        if alert is not None:
+            self._resolve(alert)
             
+    def _resolve(self, alert: SystemAlert):
+        """Resolve a known alert without searching the alert list"""
+        if alert.resolved:
+            return
+        if self._tick_ts is not None:
+            alert.mark_resolved(self._tick_ts, self._tick_iso)
+        else:
+            alert.mark_resolved(datetime.now())
+        self._retire(alert)
+        self._append_record('resolve', alert)
+        
+        # Emit signal for UI update
+        self.alert_resolved.emit(self._alert_to_dict(alert))
+        
     def get_active_alerts(self) -> List[Dict]:
         """Get list of active alerts"""
-        return [
-            self._alert_to_dict(alert)
-            for alert in self.active_alerts
-            if not alert.resolved
-        ]
+        to_dict = self._alert_to_dict
+        return [to_dict(alert) for alert in self.active_alerts]
         
     def get_alert_history(self, days: int = 7) -> List[Dict]:
         """Get alert history for specified number of days"""
         cutoff = datetime.now() - timedelta(days=days)
-        return [
-            self._alert_to_dict(alert)
-            for alert in self.active_alerts
-            if alert.timestamp > cutoff
-        ]
+        by_time = self._by_time
+        start = bisect.bisect_right(by_time, cutoff, key=_BY_TIMESTAMP)
+        to_dict = self._alert_to_dict
+        return [to_dict(alert) for alert in by_time[start:]]
         
     def _check_resolved_alerts(self, health_status: Dict):
         """Check if any active alerts can be resolved"""
-        for i, alert in enumerate(self.active_alerts):
-            if alert.resolved:
+        if not self._active_index:
+            return
+        index = self._active_index
+        for key, op, crit, warn, category, *_ in self._RULES:
+            warning_key = (category, AlertSeverity.WARNING)
+            critical_key = (category, AlertSeverity.CRITICAL)
+            if warning_key not in index and critical_key not in index:
                 continue
                 
-            # Check if condition is resolved
-            resolved = False
-            
-            if alert.category == "disk_space":
-                resolved = health_status['disk_space'] > self.thresholds['disk_space_warning']
-            elif alert.category == "memory":
-                resolved = health_status['memory_usage'] < self.thresholds['memory_warning']
-            elif alert.category == "cpu":
-                resolved = health_status['cpu_usage'] < self.thresholds['cpu_warning']
-            elif alert.category == "temperature":
-                temp = health_status.get('cpu_temp')
-                if temp:
-                    resolved = temp < self.thresholds['temperature_warning']
-                    
-            if resolved:
-                self.resolve_alert(i)
+            value = health_status.get(key)
+            if value is None:
+                continue
                 
+            # Condition is resolved once the value is back past the warning level
+            if op(warn, value):
+                for alert_key in (warning_key, critical_key):
+                    alert = index.get(alert_key)
+                    if alert is not None:
+                        self._resolve(alert)
+                        
     def _alert_to_dict(self, alert: SystemAlert) -> Dict:
         """Convert alert to dictionary for serialization"""
-        return {
-            'timestamp': alert.timestamp.isoformat(),
+        if alert._cached_dict is not None:
+            return alert._cached_dict
+        alert._cached_dict = {
+            'id': alert.id,
+            'timestamp': alert._timestamp_iso or alert.timestamp.isoformat(),
             'severity': alert.severity.value,
             'category': alert.category,
             'message': alert.message,
             'resource_info': alert.resource_info,
             'acknowledged': alert.acknowledged,
             'resolved': alert.resolved,
-            'resolution_time': alert.resolution_time.isoformat() 
-                             if alert.resolution_time else None
+            'resolution_time': alert._resolution_iso
         }
+        return alert._cached_dict
+
+    def _alert_from_dict(self, data: Dict) -> SystemAlert:
+        """Rebuild an alert from its serialized form"""
+        return self._alerts_from_dicts((data,))[0]
+        
+    def _alerts_from_dicts(self, rows) -> List[SystemAlert]:
+        """Rebuild a sequence of alerts from their serialized form"""
+        fromiso = datetime.fromisoformat
+        severity_of = _SEV_CACHE.__getitem__
+        fields = _ALERT_FIELDS
+        alerts = []
+        append = alerts.append
+        for row in rows:
+            timestamp, severity, category, message, resource_info, acknowledged, resolved = fields(row)
+            resolution_time = row.get('resolution_time')
+            append(SystemAlert(
+                timestamp=fromiso(timestamp),
+                severity=severity_of(severity),
+                category=category,
+                message=message,
+                resource_info=resource_info,
+                acknowledged=acknowledged,
+                resolved=resolved,
+                resolution_time=fromiso(resolution_time) if resolution_time else None,
+                id=row.get('id'),
+                _timestamp_iso=timestamp
+            ))
+        return alerts
+        
+    def _open_journal(self):
+        """Open the alert journal for appending"""
+        try:
+            self._alerts_fh = open(self._journal_file, "ab")
+            self._journal_size = self._alerts_fh.tell()
+        except Exception as e:
+            self.logger.error(f"Failed to open alert journal: {e}")
+            
+    def _append_record(self, op: str, alert: SystemAlert, alert_dict: Optional[Dict] = None):
+        """Append a single alert mutation to the journal"""
+        if op == 'raise':
+            record = {'op': op, 'alert': alert_dict or self._alert_to_dict(alert)}
+        elif op == 'resolve':
+            record = {
+                'op': op,
+                'id': alert.id,
+                'resolution_time': alert._resolution_iso
+            }
+        else:
+            record = {'op': op, 'id': alert.id}
+            
+        self._pending_records.append(
+            _dumps(record) + b'\n'
+        )
+        self._dirty = True
+        self._save_timer.start()
         
+    def _do_save(self):
+        """Flush pending journal records to disk"""
+        if not self._dirty:
+            return
+            
+        if self._alerts_fh is None:
+            self._save_alerts()
+            return
+            
+        try:
+            buf = b''.join(self._pending_records)
+            self._pending_records.clear()
+            self._dirty = False
+            os.write(self._alerts_fh.fileno(), buf)
+            self._journal_size += len(buf)
+            if self._journal_size > self._journal_limit:
+                self._save_alerts()
+        except Exception as e:
+            self.logger.error(f"Failed to append alert records: {e}")
+            
+    def shutdown(self):
+        """Flush pending alert changes and close the journal"""
+        self._save_timer.stop()
+        self._do_save()
+        if self._alerts_fh is not None:
+            self._alerts_fh.close()
+            self._alerts_fh = None
+            
     def _save_alerts(self):
-        """Save alerts to disk"""
+        """Write a full snapshot to disk and truncate the journal"""
         try:
-            alerts_file = self.alerts_dir / "alerts.json"
-            alerts_data = [self._alert_to_dict(alert) for alert in self.active_alerts]
-            alerts_file.write_text(json.dumps(alerts_data, indent=2))
+            to_dict = self._alert_to_dict
+            alerts_data = {
+                'active': [to_dict(alert) for alert in self.active_alerts],
+                'history': [to_dict(alert) for alert in self.history]
+            }
+            with open(self._snapshot_tmp, "wb") as f:
+                f.write(_dumps(alerts_data))
+            os.replace(self._snapshot_tmp, self._snapshot_file)
+            self._pending_records.clear()
+            self._dirty = False
+            
+            if self._alerts_fh is not None:
+                os.ftruncate(self._alerts_fh.fileno(), 0)
+                self._journal_size = 0
         except Exception as e:
             self.logger.error(f"Failed to save alerts: {e}")
             
     def _load_alerts(self):
-        """Load alerts from disk"""
+        """Load the alert snapshot from disk and replay the journal"""
         try:
-            alerts_file = self.alerts_dir / "alerts.json"
-            if alerts_file.exists():
-                alerts_data = json.loads(alerts_file.read_text())
-                self.active_alerts = [
-                    SystemAlert(
-                        timestamp=datetime.fromisoformat(alert['timestamp']),
-                        severity=AlertSeverity(alert['severity']),
-                        category=alert['category'],
-                        message=alert['message'],
-                        resource_info=alert['resource_info'],
-                        acknowledged=alert['acknowledged'],
-                        resolved=alert['resolved'],
-                        resolution_time=datetime.fromisoformat(alert['resolution_time'])
-                                    if alert['resolution_time'] else None
-                    )
-                    for alert in alerts_data
-                ]
+            if os.path.exists(self._snapshot_file):
+                with open(self._snapshot_file, "rb") as f:
+                    alerts_data = _loads(f.read())
+                if isinstance(alerts_data, list):
+                    # Older snapshots are a flat list of active and resolved alerts
+                    alerts = self._alerts_from_dicts(alerts_data)
+                    for position, alert in enumerate(alerts):
+                        if alert.id is None:
+                            alert.id = position
+                    self.active_alerts = [a for a in alerts if not a.resolved]
+                    self.history.extend(a for a in alerts if a.resolved)
+                else:
+                    self.active_alerts = self._alerts_from_dicts(alerts_data['active'])
+                    self.history.extend(self._alerts_from_dicts(alerts_data['history']))
+            self._by_id = {alert.id: alert for alert in self.active_alerts}
+                
+            if os.path.exists(self._journal_file):
+                with open(self._journal_file, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            self._replay_record(_loads(line))
         except Exception as e:
-            self.logger.error(f"Failed to load alerts: {e}") 
\ No newline at end of file
+            self.logger.error(f"Failed to load alerts: {e}")
+            
+        self._rebuild_index()
+        
+    def _replay_record(self, record: Dict):
+        """Apply a journal record to the in-memory alert list"""
+        op = record.pop('op')
+        if op == 'raise':
+            alert = self._alert_from_dict(record['alert'])
+            self.active_alerts.append(alert)
+            self._by_id[alert.id] = alert
+            return
+            
+        alert = self._by_id.get(record['id'])
+        if alert is not None:
+            if op == 'ack':
+                alert.mark_acknowledged()
+            elif op == 'resolve':
+                resolution_iso = record['resolution_time']
+                alert.mark_resolved(datetime.fromisoformat(resolution_iso), resolution_iso)
+                self._retire(alert)
+                
+    def _rebuild_index(self):
+        """Rebuild the duplicate-check index from the alert list"""
+        self._active_index = {}
+        self._by_id = {}
+        for alert in self.active_alerts:
+            self._by_id[alert.id] = alert
+            self._active_index[(alert.category, alert.severity)] = alert
+        self._by_time = sorted((*self.history, *self.active_alerts), key=_BY_TIMESTAMP)
+        last_id = max((alert.id for alert in self.history), default=-1)
+        self._next_id = max(max(self._by_id, default=-1), last_id) + 1
+        
+    def _retire(self, alert: SystemAlert):
+        """Move a resolved alert out of the active set into history"""
+        key = (alert.category, alert.severity)
+        if self._active_index.get(key) is alert:
+            del self._active_index[key]
+        self._by_id.pop(alert.id, None)
+        self.active_alerts.remove(alert)
+        if len(self.history) == self.history.maxlen:
+            self._drop_from_timeline(self.history[0])
+        self.history.append(alert)
+        
+    def _drop_from_timeline(self, alert: SystemAlert):
+        """Remove an alert evicted from history from the time-ordered list"""
+        by_time = self._by_time
+        i = bisect.bisect_left(by_time, alert.timestamp, key=_BY_TIMESTAMP)
+        while i < len(by_time) and by_time[i].timestamp == alert.timestamp:
+            if by_time[i] is alert:
+                del by_time[i]
+                return
+            i += 1 
\ No newline at end of file
@@ -0,0 +1,31 @@
+import hashlib
+from typing import Iterable
+
+class BloomFilter:
+    """Fixed-size Bloom filter over byte strings
+
+    Membership tests may return false positives but never false negatives,
+    so a miss is proof the item was never added.
+    """
+
+    def __init__(self, expected_items: int, bits_per_item: int = 10, num_hashes: int = 7):
+        self.size = max(64, expected_items * bits_per_item)
+        self.num_hashes = num_hashes
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: bytes) -> Iterable[int]:
+        """Derive bit positions by double hashing one 128-bit digest"""
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.num_hashes))
+
+    def add(self, item: bytes):
+        bits = self.bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: bytes) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
@@ -1,15 +1,23 @@
+import atexit
+import ctypes
+import ctypes.util
 import hashlib
 import os
+import sys
 import logging
-import subprocess
 import shutil
+import threading
 import time
 import re
 import psutil
 import json
 import base64
 from cryptography.fernet import Fernet
-from concurrent.futures import ThreadPoolExecutor
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, List, Optional, Tuple, Set
 from pathlib import Path
 from dataclasses import dataclass
@@ -18,7 +26,6 @@ from .quarantine_manager import QuarantineManager
 from .system_monitor import SystemMonitor
 from .scan_optimizer import ScanOptimizer
 import asyncio
-from concurrent.futures import as_completed
 from .latency_monitor import LatencyMonitor
 from .platform_utils import PlatformUtils
 from .performance_monitor import PerformanceMonitor
@@ -26,8 +33,8 @@ from .resource_throttler import ResourceThrottler
 from .performance_analyzer import PerformanceAnalyzer
 from .system_health_monitor import SystemHealthMonitor
 from .scan_intensity_manager import ScanIntensityManager
-import gc
-import weakref
+from .bloom_filter import BloomFilter
+from collections import OrderedDict
 from typing import Iterator
 import yara  # You'll need to install this: pip install yara-python
 
@@ -39,6 +46,202 @@ except ImportError:
     HAS_MAGIC = False
     print("libmagic not found - file type detection will be limited")
 
+# Hyperscan is optional; without it signature patterns use a combined re
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# xxHash is optional; without it file prefixes are keyed with BLAKE2b
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def _loads(data: bytes):
+    """Parse JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# psutil.Process objects reused by behavior checks, and for how long (seconds)
+PROCESS_CACHE_SIZE = 1024
+PROCESS_CACHE_TTL = 2.0
+# Seconds between background CPU samples of cached processes
+CPU_SAMPLE_INTERVAL = 0.5
+# Seconds of blocking CPU sampling for a process the sampler hasn't reached yet
+FIRST_CPU_SAMPLE_INTERVAL = 0.1
+
+# Scan tasks submitted per worker process for each batch
+SCAN_CHUNKS_PER_WORKER = 4
+
+# Content checks per file type as (full magic, run YARA, run signature
+# patterns), keyed by the first two bytes so dispatch is one dict lookup.
+# Compressed containers skip both since their payload can't match as-is
+_TYPE_CHECKS = {
+    b'MZ': (b'MZ', True, False),                        # PE executable
+    b'\x7fE': (b'\x7fELF', True, False),                # ELF executable
+    b'#!': (b'#!', True, True),                         # Script
+    b'PK': (b'PK\x03\x04', False, False),               # ZIP archive
+    b'\x1f\x8b': (b'\x1f\x8b', False, False),           # gzip
+    b'7z': (b'7z\xbc\xaf\x27\x1c', False, False),       # 7-Zip
+    b'Ra': (b'Rar!\x1a\x07', False, False),             # RAR
+}
+
+def _content_checks(head: bytes) -> Tuple[bool, bool]:
+    """Return (run YARA, run signature patterns) for a file's leading bytes"""
+    entry = _TYPE_CHECKS.get(head[:2])
+    if entry is not None and head.startswith(entry[0]):
+        return entry[1], entry[2]
+    return True, True
+
+# Files larger than this are reported as skipped rather than scanned
+MAX_SCAN_SIZE = 100 * 1024 * 1024
+
+def _skipped_result(file_path) -> Dict:
+    """Scan result for a file too large to scan"""
+    return {
+        'file_path': str(file_path),
+        'status': 'skipped',
+        'reason': 'File too large'
+    }
+
+def _walk_files(root: Path, skip_dirs: Set[str]) -> Iterator[os.DirEntry]:
+    """Iteratively yield files under root, skipping names in skip_dirs
+    
+    Uses os.scandir so file type comes from the directory listing and each
+    entry's stat() result is cached on the DirEntry. Like Path.rglob,
+    symlinked files are yielded but symlinked directories aren't descended.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.name in skip_dirs:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+# Read size used when hashing files
+HASH_CHUNK_SIZE = 1024 * 1024
+
+def _sha256_file(file_path) -> Tuple[str, int]:
+    """Return the SHA-256 hex digest and size of a file
+    
+    The file is read in 1 MiB chunks into one reusable buffer. It isn't
+    memory-mapped: a file truncated by another process while mapped raises
+    SIGBUS, which would kill the process rather than fail the one file.
+    """
+    digest = hashlib.sha256()
+    buf = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buf)
+    size = 0
+    with open(file_path, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            size += n
+            digest.update(view[:n])
+    return digest.hexdigest(), size
+
+# Linux fallocate(2) flags that release a file's blocks without resizing it
+FALLOC_FL_KEEP_SIZE = 0x01
+FALLOC_FL_PUNCH_HOLE = 0x02
+# Windows ioctl that zeroes (and on sparse files deallocates) a byte range
+FSCTL_SET_ZERO_DATA = 0x000980C8
+
+# Quarantine blob layout: magic, GCM nonce, ciphertext, GCM tag
+QUARANTINE_MAGIC = b'AVQ1'
+GCM_NONCE_SIZE = 12
+GCM_TAG_SIZE = 16
+CRYPT_CHUNK_SIZE = 1 << 20
+# update_into needs room for up to one AES block minus one beyond its input
+CRYPT_BLOCK_SLACK = 15
+
+# Reusable buffer for single-pass zero overwrites
+_ZERO_BUFFER = bytes(1 << 20)
+
+def _deallocate_range(fd: int, size: int) -> bool:
+    """Ask the filesystem to discard a file's data in place
+    
+    Returns False when the platform or filesystem doesn't support it, in
+    which case the caller should overwrite the data itself.
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fallocate = getattr(libc, 'fallocate64', libc.fallocate)
+            fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+            return fallocate(fd, FALLOC_FL_PUNCH_HOLE | FALLOC_FL_KEEP_SIZE, 0, size) == 0
+        if sys.platform == 'win32':
+            import msvcrt
+            from ctypes import wintypes
+            zero_range = (ctypes.c_int64 * 2)(0, size)
+            returned = wintypes.DWORD()
+            return bool(ctypes.windll.kernel32.DeviceIoControl(
+                wintypes.HANDLE(msvcrt.get_osfhandle(fd)), FSCTL_SET_ZERO_DATA,
+                ctypes.byref(zero_range), ctypes.sizeof(zero_range),
+                None, 0, ctypes.byref(returned), None
+            ))
+    except (OSError, AttributeError):
+        pass
+    return False
+
+# Leading bytes of a file keyed into the known-malware prefix filter
+PREFIX_SIZE = 4096
+
+def _prefix_digest(data: bytes) -> str:
+    """Return a cheap non-cryptographic digest of a file's first 4 KiB"""
+    if HAS_XXHASH:
+        return xxhash.xxh64(data[:PREFIX_SIZE]).hexdigest()
+    return hashlib.blake2b(data[:PREFIX_SIZE], digest_size=8).hexdigest()
+
+class ResultCache:
+    """Thread-safe bounded LRU of scan results keyed by (path, mtime_ns, size)"""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def get(self, key: Tuple[str, int, int]) -> Optional[Dict]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+            
+    def put(self, key: Tuple[str, int, int], result: Dict):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
 @dataclass
 class ScanStats:
     """Statistics for scanning operations"""
@@ -62,9 +265,11 @@ class ScanStats:
 class HeuristicRule:
     """Rule for heuristic-based detection"""
     name: str
-    pattern: str
+    pattern: bytes
     severity: int  # 1-10
     description: str
+    atoms: Tuple[bytes, ...] = ()  # Literals any match must contain
+    compiled: Optional[re.Pattern] = None  # Bytes pattern built at engine init
 
 @dataclass
 class QuarantineMetadata:
@@ -76,6 +281,238 @@ class QuarantineMetadata:
     original_permissions: int
     encryption_key: bytes
 
+class FileScanner:
+    """Signature, pattern and YARA checks for individual files
+    
+    Holds only picklable configuration so scan worker processes can build
+    their own instance from the engine's signatures and rule source.
+    """
+    
+    def __init__(self, virus_signatures: Dict, yara_rules: str):
+        self.logger = logging.getLogger(__name__)
+        self.virus_signatures = virus_signatures
+        self.yara_rules = yara_rules
+        self._compile_signature_patterns()
+        self._build_hash_filter()
+        self.yara_compiler = self._load_yara_rules()
+        
+    def _build_hash_filter(self):
+        """Build the Bloom filter of known-sample prefix digests
+        
+        Files whose prefix misses the filter can't match a known hash, so the
+        full SHA-256 is skipped for them. The gate is only enabled when every
+        known hash has a recorded prefix digest.
+        """
+        hashes = self.virus_signatures['hashes']
+        prefixes = self.virus_signatures.get('prefix_hashes', {})
+        self._hash_filter = BloomFilter(len(prefixes))
+        for prefix in prefixes.values():
+            self._hash_filter.add(prefix.encode())
+        self._prefix_gate = all(h in prefixes for h in hashes)
+        
+    def _load_yara_rules(self):
+        """Load precompiled YARA rules, compiling and caching them if needed"""
+        # Cache file is keyed by the rule source so edits trigger a recompile
+        source_hash = hashlib.sha256(self.yara_rules.encode()).hexdigest()[:16]
+        compiled_path = Path("data") / f"yara_rules_{source_hash}.yarac"
+        
+        if compiled_path.exists():
+            try:
+                return yara.load(str(compiled_path))
+            except Exception as e:
+                self.logger.warning(f"Failed to load compiled YARA rules: {e}")
+                
+        try:
+            rules = yara.compile(source=self.yara_rules)
+        except Exception as e:
+            self.logger.error(f"Failed to compile YARA rules: {e}")
+            return None
+            
+        try:
+            compiled_path.parent.mkdir(parents=True, exist_ok=True)
+            rules.save(str(compiled_path))
+        except Exception as e:
+            self.logger.warning(f"Failed to cache compiled YARA rules: {e}")
+        return rules
+            
+    def _compile_signature_patterns(self):
+        """Compile all suspicious byte patterns into a single matcher"""
+        patterns = self.virus_signatures['patterns']
+        
+        # Leading (?i) is turned into a per-pattern flag so patterns can be combined
+        expressions, caseless = [], []
+        for pattern in patterns:
+            nocase = pattern.startswith(b'(?i)')
+            expressions.append(pattern[4:] if nocase else pattern)
+            caseless.append(nocase)
+            
+        self._hs_db = None
+        if HAS_HYPERSCAN:
+            try:
+                db = hyperscan.Database()
+                db.compile(
+                    expressions=expressions,
+                    ids=list(range(len(expressions))),
+                    elements=len(expressions),
+                    flags=[
+                        hyperscan.HS_FLAG_SINGLEMATCH |
+                        (hyperscan.HS_FLAG_CASELESS if nocase else 0)
+                        for nocase in caseless
+                    ]
+                )
+                self._hs_db = db
+                self._hs_scratch = hyperscan.Scratch(db)
+                self._hs_local = threading.local()  # Scratch space is per thread
+            except Exception as e:
+                self.logger.warning(f"Hyperscan compilation failed, using re: {e}")
+                
+        self._pattern_regex = re.compile(b'|'.join(
+            (b'(?i:' if nocase else b'(?:') + expr + b')'
+            for expr, nocase in zip(expressions, caseless)
+        ))
+        
+    def _matches_signature_pattern(self, content: bytes) -> bool:
+        """Check content against all suspicious patterns in one pass"""
+        if self._hs_db is not None:
+            scratch = getattr(self._hs_local, 'scratch', None)
+            if scratch is None:
+                scratch = self._hs_local.scratch = self._hs_scratch.clone()
+            hits = []
+            self._hs_db.scan(
+                content,
+                match_event_handler=lambda *args: hits.append(args[0]),
+                scratch=scratch
+            )
+            return bool(hits)
+        return self._pattern_regex.search(content) is not None
+        
+    def scan_file(self, file_path: Path, size: Optional[int] = None) -> Dict[str, any]:
+        """Scan a single file for threats
+        
+        size may be passed when the caller already has it from a directory
+        walk, saving the existence check and a stat. Results carry the file's
+        SHA-256 under 'hash' only when it was computed; files the prefix
+        filter rules out of a known-malware match have no 'hash' key.
+        """
+        try:
+            if size is None and not file_path.is_file():
+                return {
+                    'file_path': str(file_path),
+                    'status': 'error',
+                    'error': 'File not found or not accessible'
+                }
+                
+            threats = []
+            
+            with open(file_path, 'rb') as f:
+                fd = f.fileno()
+                if size is None:
+                    size = os.fstat(fd).st_size
+                
+                # 1. Check file size
+                if size > MAX_SCAN_SIZE:
+                    return _skipped_result(file_path)
+                    
+                # 2. Check file extension
+                if file_path.suffix.lower() in self.virus_signatures['suspicious_extensions']:
+                    threats.append({
+                        'type': 'suspicious_extension',
+                        'details': f'Suspicious file extension: {file_path.suffix}',
+                        'severity': 3
+                    })
+                    
+                # 3. Hash and content checks share one read of the file. It
+                # isn't memory-mapped, since a scanned file truncated while
+                # mapped raises SIGBUS and kills the process
+                if size and hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                file_hash = self._scan_buffer(f.read(), threats)
+                        
+            # 4. Get file type if magic is available
+            file_type = "unknown"
+            try:
+                if HAS_MAGIC:
+                    file_type = magic.from_file(str(file_path))
+                else:
+                    # Basic file type detection based on extension
+                    file_type = file_path.suffix.lower()[1:] if file_path.suffix else "unknown"
+            except Exception as e:
+                self.logger.warning(f"Error detecting file type: {e}")
+                
+            # Return scan results
+            result = {
+                'file_path': str(file_path),
+                'status': 'infected' if threats else 'clean',
+                'threats': threats,
+                'file_type': file_type
+            }
+            if file_hash is not None:
+                result['hash'] = file_hash
+            return result
+            
+        except Exception as e:
+            self.logger.error(f"Error scanning file {file_path}: {e}")
+            return {
+                'file_path': str(file_path),
+                'status': 'error',
+                'error': str(e)
+            }
+            
+    def _scan_buffer(self, buf, threats: List[Dict]) -> Optional[str]:
+        """Hash and pattern-check a file's contents in a single pass
+        
+        Appends any findings to threats and returns the SHA-256 hex digest,
+        or None when the prefix filter ruled out a known-malware match.
+        """
+        file_hash = None
+        if (not self._prefix_gate
+                or _prefix_digest(buf[:PREFIX_SIZE]).encode() in self._hash_filter):
+            file_hash = hashlib.sha256(buf).hexdigest()
+            if file_hash in self.virus_signatures['hashes']:
+                threats.append({
+                    'type': 'known_malware',
+                    'details': 'File matches known malware signature',
+                    'severity': 10
+                })
+            
+        run_yara, run_patterns = _content_checks(buf[:8])
+        try:
+            # Apply YARA rules if available
+            if run_yara and self.yara_compiler:
+                matches = self.yara_compiler.match(data=buf, fast=True, timeout=5)
+                for match in matches:
+                    threats.append({
+                        'type': 'yara_match',
+                        'details': f'Matched YARA rule: {match.rule}',
+                        'severity': 8
+                    })
+                    
+            # Check for suspicious patterns
+            if run_patterns and self._matches_signature_pattern(buf):
+                threats.append({
+                    'type': 'suspicious_pattern',
+                    'details': 'File contains suspicious code patterns',
+                    'severity': 7
+                })
+                
+        except Exception as e:
+            self.logger.warning(f"Error analyzing file content: {e}")
+            
+        return file_hash
+
+# Scanner owned by each scan worker process, built once by _worker_init
+_worker_scanner: Optional[FileScanner] = None
+
+def _worker_init(virus_signatures: Dict, yara_rules: str):
+    """Build the per-process scanner when a scan worker starts"""
+    global _worker_scanner
+    _worker_scanner = FileScanner(virus_signatures, yara_rules)
+
+def _scan_chunk_in_worker(items: List[Tuple[str, int]]) -> List[Dict]:
+    """Scan a chunk of (path, size) pairs inside a worker process"""
+    scanner = _worker_scanner
+    return [scanner.scan_file(Path(path_str), size) for path_str, size in items]
+
 class ScanEngine:
     """Core scanning engine for malware detection"""
     
@@ -93,8 +530,10 @@ class ScanEngine:
         )
         self.quarantine_path = Path("quarantine")
         self.quarantine_meta_path = self.quarantine_path / "metadata.json"
-        self.quarantine_key = Fernet.generate_key()
-        self.fernet = Fernet(self.quarantine_key)
+        self._quarantine_meta_cache: Optional[Dict] = None
+        self._quarantine_meta_dirty = False
+        self._quarantine_meta_lock = threading.Lock()
+        self.quarantine_key = AESGCM.generate_key(bit_length=256)
         self.stats = ScanStats(start_time=time.time())
         
         # Initialize quarantine directory
@@ -104,18 +543,31 @@ class ScanEngine:
         self.heuristic_rules: List[HeuristicRule] = [
             HeuristicRule(
                 name="Suspicious Script",
-                pattern=r"(eval|exec)\s*\(\s*base64\.b64decode",
+                pattern=rb"(eval|exec)\s*\(\s*base64\.b64decode",
                 severity=8,
-                description="Possible encoded malicious code execution"
+                description="Possible encoded malicious code execution",
+                atoms=(b"base64.b64decode",)
             ),
             HeuristicRule(
                 name="System Modification",
-                pattern=r"(registry\.write|regwrite|regedit)",
+                pattern=rb"(registry\.write|regwrite|regedit)",
                 severity=7,
-                description="Attempt to modify system registry"
+                description="Attempt to modify system registry",
+                atoms=(b"registry.write", b"regwrite", b"regedit")
             ),
             # Add more rules as needed
         ]
+        self._build_heuristic_atoms()
+        
+        # psutil.Process objects keyed by pid, with their expiry time
+        self._process_cache: Dict[int, Tuple[psutil.Process, float]] = {}
+        
+        # CPU percent of cached processes, refreshed by a sampler thread that
+        # starts with the first process lookup and stops at shutdown()
+        self._cpu_samples: Dict[int, float] = {}
+        self._cpu_sampler: Optional[threading.Thread] = None
+        self._cpu_sampler_lock = threading.Lock()
+        self._cpu_sampler_stop = threading.Event()
         
         # Known suspicious process behaviors
         self.suspicious_behaviors: Set[str] = {
@@ -185,7 +637,6 @@ class ScanEngine:
         self.intensity_manager = ScanIntensityManager(self.health_monitor)
 
         # Add memory optimization settings
-        self.cache = weakref.WeakValueDictionary()  # Use weak references for caching
         self.batch_size = 1000  # Process files in smaller batches
 
         # Register cleanup handler
@@ -195,6 +646,9 @@ class ScanEngine:
         self._temp_data = {}
         self.max_batch_size = 500  # Reduce batch size
         self.signature_cache_size = 1000  # Limit signature cache
+        
+        # Scan results for unchanged files, keyed by path, mtime and size
+        self.cache = ResultCache(self.signature_cache_size)
 
         # Initialize virus detection components
         self.virus_signatures = {
@@ -203,6 +657,11 @@ class ScanEngine:
                 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855',  # Example malware hash
             ]),
             
+            # Digest of each known sample's first 4 KiB, keyed by its SHA-256
+            'prefix_hashes': {
+                'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855': _prefix_digest(b''),
+            },
+            
             # Suspicious file patterns
             'patterns': [
                 rb'(?i)(?:eval|exec)\s*\(\s*(?:base64|compile|marshal)\.(?:b64decode|loads)',  # Encoded execution
@@ -252,13 +711,42 @@ class ScanEngine:
             }
         """
         
-        # Compile YARA rules
-        try:
-            self.yara_compiler = yara.compile(source=self.yara_rules)
-        except Exception as e:
-            self.logger.error(f"Failed to compile YARA rules: {e}")
-            self.yara_compiler = None
-            
+        # Compiled signature matchers used for in-process scans
+        self.scanner = FileScanner(self.virus_signatures, self.yara_rules)
+        self.yara_compiler = self.scanner.yara_compiler
+        
+        # CPU-bound file scans run in worker processes so they aren't bound
+        # by the GIL; each worker compiles its own FileScanner once at startup
+        self._create_scan_pool(self.max_threads)
+        atexit.register(self.shutdown)
+        
+    def _create_scan_pool(self, workers: int):
+        """Start a scan worker pool with the given number of processes"""
+        self.scan_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_worker_init,
+            initargs=(self.virus_signatures, self.yara_rules)
+        )
+        self._scan_pool_workers = workers
+        
+    def _replace_scan_pool(self):
+        """Swap the scan pool for a new one sized to the current thread cap
+        
+        Used after a worker died, which leaves the whole pool broken, and to
+        apply a thread cap changed by throttling. Tasks still running in the
+        old pool finish in the background.
+        """
+        old_pool = self.scan_pool
+        self._create_scan_pool(self.max_threads)
+        old_pool.shutdown(wait=False)
+        
+    def shutdown(self):
+        """Stop the scan worker processes, thread pool and CPU sampler"""
+        self._cpu_sampler_stop.set()
+        self.scan_pool.shutdown(wait=False, cancel_futures=True)
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        
     def _init_quarantine_metadata(self):
         """Initialize quarantine metadata storage"""
         try:
@@ -270,49 +758,126 @@ class ScanEngine:
             raise
 
     def _load_quarantine_metadata(self) -> Dict:
-        """Load quarantine metadata from disk"""
-        try:
-            return json.loads(self.quarantine_meta_path.read_text())
-        except Exception as e:
-            self.logger.error(f"Error loading quarantine metadata: {e}")
-            return {}
+        """Return quarantine metadata, reading it from disk on first use"""
+        if self._quarantine_meta_cache is None:
+            try:
+                self._quarantine_meta_cache = _loads(self.quarantine_meta_path.read_bytes())
+            except Exception as e:
+                self.logger.error(f"Error loading quarantine metadata: {e}")
+                return {}
+            atexit.register(self._flush_quarantine_metadata)
+        return self._quarantine_meta_cache
 
     def _save_quarantine_metadata(self, metadata: Dict):
-        """Save quarantine metadata to disk"""
+        """Update cached quarantine metadata and schedule a write to disk"""
+        self._quarantine_meta_cache = metadata
+        self._quarantine_meta_dirty = True
+        # Queued writes coalesce: each flush persists the latest state
         try:
-            self.quarantine_meta_path.write_text(json.dumps(metadata, indent=2))
-        except Exception as e:
-            self.logger.error(f"Error saving quarantine metadata: {e}")
-            raise
+            self.executor.submit(self._flush_quarantine_metadata)
+        except RuntimeError:
+            # Executor already shut down; write synchronously instead
+            self._flush_quarantine_metadata()
 
+    def _flush_quarantine_metadata(self):
+        """Atomically write cached quarantine metadata if it has changed"""
+        with self._quarantine_meta_lock:
+            if not self._quarantine_meta_dirty:
+                return
+            self._quarantine_meta_dirty = False
+            tmp_path = self.quarantine_meta_path.with_suffix('.tmp')
+            try:
+                tmp_path.write_bytes(_dumps(dict(self._quarantine_meta_cache)))
+                os.replace(tmp_path, self.quarantine_meta_path)
+            except Exception as e:
+                self._quarantine_meta_dirty = True
+                self.logger.error(f"Error saving quarantine metadata: {e}")
+
+    def scan_file(self, file_path: Path) -> Dict[str, any]:
+        """Scan a single file for threats in the current process"""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return self.scanner.scan_file(file_path)
+        key = (str(file_path), st.st_mtime_ns, st.st_size)
+        result = self.cache.get(key)
+        if result is None:
+            result = self.scanner.scan_file(file_path, st.st_size)
+            if result.get('status') in ('clean', 'infected'):
+                self.cache.put(key, result)
+        return result
+        
     def calculate_file_hash(self, file_path: Path) -> Optional[str]:
         """Calculate SHA-256 hash of a file"""
         try:
-            with open(file_path, 'rb') as f:
-                file_hash = hashlib.sha256()
-                while chunk := f.read(8192):  # Read in 8kb chunks
-                    self.stats.bytes_scanned += len(chunk)
-                    file_hash.update(chunk)
-            return file_hash.hexdigest()
+            file_hash, size = _sha256_file(file_path)
+            self.stats.bytes_scanned += size
+            return file_hash
         except (IOError, OSError) as e:
             self.logger.error(f"Error calculating hash for {file_path}: {e}")
             self.stats.files_error += 1
             return None
 
+    def _get_process(self, pid: int) -> psutil.Process:
+        """Return a cached psutil.Process for pid, evicted after PROCESS_CACHE_TTL idle
+        
+        Reusing the object keeps its cpu_percent baseline between calls.
+        is_running() compares create_time, so a recycled pid isn't mistaken
+        for the cached process.
+        """
+        if self._cpu_sampler is None:
+            self._start_cpu_sampler()
+        now = time.monotonic()
+        cached = self._process_cache.get(pid)
+        if cached is not None and cached[0].is_running():
+            process = cached[0]
+        else:
+            process = psutil.Process(pid)
+            # Prime the CPU baseline so later non-blocking reads have an interval
+            process.cpu_percent(interval=None)
+            if len(self._process_cache) >= PROCESS_CACHE_SIZE:
+                self._process_cache = {
+                    p: entry for p, entry in self._process_cache.items() if entry[1] > now
+                }
+        self._process_cache[pid] = (process, now + PROCESS_CACHE_TTL)
+        return process
+
+    def _start_cpu_sampler(self):
+        """Start the background CPU sampler thread if it isn't running yet"""
+        with self._cpu_sampler_lock:
+            if self._cpu_sampler is None:
+                self._cpu_sampler = threading.Thread(
+                    target=self._sample_process_cpu, name="ProcessCpuSampler", daemon=True
+                )
+                self._cpu_sampler.start()
+                
+    def _sample_process_cpu(self):
+        """Refresh CPU usage of recently checked processes in the background"""
+        while not self._cpu_sampler_stop.wait(CPU_SAMPLE_INTERVAL):
+            now = time.monotonic()
+            samples = {}
+            for pid, (process, expires) in list(self._process_cache.items()):
+                if expires <= now:
+                    continue
+                try:
+                    samples[pid] = process.cpu_percent(interval=None)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+            self._cpu_samples = samples
+
     def check_process_behavior(self, pid: int) -> Tuple[bool, str]:
         """Monitor process behavior for suspicious activities"""
         try:
-            if os.name == 'nt':  # Windows
-                cmd = f"tasklist /FI \"PID eq {pid}\" /FO CSV /V"
-            else:  # Unix-like
-                cmd = f"ps -p {pid} -o %cpu,%mem,cmd"
-                
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            info = self._get_process(pid).as_dict(
+                attrs=['name', 'cmdline', 'cpu_percent', 'memory_percent', 'num_threads']
+            )
             # Basic behavior analysis (to be expanded)
-            if process.returncode == 0:
+            if info:
                 # Add behavior analysis logic here
                 return False, "Process behavior normal"
             return False, "Process not found"
+        except psutil.NoSuchProcess:
+            return False, "Process not found"
         except Exception as e:
             self.logger.error(f"Error checking process behavior: {e}")
             return False, str(e)
@@ -326,16 +891,8 @@ class ScanEngine:
             quarantine_name = f"{timestamp}_{file_hash[:8]}_{file_path.name}"
             quarantine_file = self.quarantine_path / quarantine_name
 
-            # Read original file content
-            with open(file_path, 'rb') as f:
-                content = f.read()
-
-            # Encrypt the content
-            encrypted_content = self.fernet.encrypt(content)
-
-            # Save encrypted content
-            with open(quarantine_file, 'wb') as f:
-                f.write(encrypted_content)
+            # Stream the original through AES-GCM into quarantine
+            self._encrypt_to_quarantine(file_path, quarantine_file)
 
             # Create metadata
             metadata = self._load_quarantine_metadata()
@@ -345,7 +902,8 @@ class ScanEngine:
                 'file_hash': file_hash,
                 'threat_info': threats,
                 'original_permissions': file_path.stat().st_mode,
-                'encryption_key': base64.b64encode(self.quarantine_key).decode()
+                'encryption_key': base64.b64encode(self.quarantine_key).decode(),
+                'cipher': 'aes-256-gcm'
             }
             self._save_quarantine_metadata(metadata)
 
@@ -371,18 +929,18 @@ class ScanEngine:
             quarantine_file = self.quarantine_path / quarantine_name
             original_path = Path(file_meta['original_path'])
 
-            # Read and decrypt file content
-            with open(quarantine_file, 'rb') as f:
-                encrypted_content = f.read()
-            
-            decryption_key = base64.b64decode(file_meta['encryption_key'])
-            fernet = Fernet(decryption_key)
-            decrypted_content = fernet.decrypt(encrypted_content)
-
             # Restore file to original location
             original_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(original_path, 'wb') as f:
-                f.write(decrypted_content)
+            decryption_key = base64.b64decode(file_meta['encryption_key'])
+            if file_meta.get('cipher') == 'aes-256-gcm':
+                self._decrypt_from_quarantine(quarantine_file, original_path, decryption_key)
+            else:
+                # Entries quarantined before AES-GCM are whole Fernet tokens
+                with open(quarantine_file, 'rb') as f:
+                    encrypted_content = f.read()
+                decrypted_content = Fernet(decryption_key).decrypt(encrypted_content)
+                with open(original_path, 'wb') as f:
+                    f.write(decrypted_content)
 
             # Restore original permissions
             os.chmod(original_path, file_meta['original_permissions'])
@@ -399,18 +957,89 @@ class ScanEngine:
             self.logger.error(f"Restore failed for {quarantine_name}: {e}")
             return False
 
-    def _secure_delete(self, file_path: Path):
-        """Securely delete a file by overwriting with random data"""
+    def _encrypt_to_quarantine(self, src_path: Path, dst_path: Path):
+        """Encrypt a file into a quarantine blob in fixed-size chunks
+        
+        Plaintext and ciphertext each go through one reusable buffer, so no
+        per-chunk bytes objects are allocated.
+        """
+        nonce = os.urandom(GCM_NONCE_SIZE)
+        encryptor = Cipher(algorithms.AES(self.quarantine_key), modes.GCM(nonce)).encryptor()
+        buf = bytearray(CRYPT_CHUNK_SIZE)
+        view = memoryview(buf)
+        out = memoryview(bytearray(CRYPT_CHUNK_SIZE + CRYPT_BLOCK_SLACK))
+        with open(src_path, 'rb', buffering=0) as src, open(dst_path, 'wb') as dst:
+            dst.write(QUARANTINE_MAGIC + nonce)
+            while n := src.readinto(buf):
+                n = encryptor.update_into(view[:n], out)
+                dst.write(out[:n])
+            dst.write(encryptor.finalize())
+            dst.write(encryptor.tag)
+
+    def _decrypt_from_quarantine(self, src_path: Path, dst_path: Path, key: bytes):
+        """Decrypt a quarantine blob in fixed-size chunks
+        
+        Plaintext goes to a temporary file that only replaces dst_path once
+        the GCM tag has been verified.
+        """
+        header_size = len(QUARANTINE_MAGIC) + GCM_NONCE_SIZE
+        tmp_path = dst_path.with_name(dst_path.name + '.restore')
+        try:
+            with open(src_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                header = src.read(header_size)
+                if not header.startswith(QUARANTINE_MAGIC):
+                    raise ValueError(f"Not a quarantine blob: {src_path}")
+                remaining = os.fstat(src.fileno()).st_size - header_size - GCM_TAG_SIZE
+                src.seek(-GCM_TAG_SIZE, os.SEEK_END)
+                tag = src.read(GCM_TAG_SIZE)
+                src.seek(header_size)
+                decryptor = Cipher(
+                    algorithms.AES(key), modes.GCM(header[len(QUARANTINE_MAGIC):], tag)
+                ).decryptor()
+                chunk = memoryview(bytearray(CRYPT_CHUNK_SIZE))
+                out = memoryview(bytearray(CRYPT_CHUNK_SIZE + CRYPT_BLOCK_SLACK))
+                while remaining > 0:
+                    n = src.readinto(chunk[:min(CRYPT_CHUNK_SIZE, remaining)])
+                    if not n:
+                        raise ValueError(f"Truncated quarantine blob: {src_path}")
+                    remaining -= n
+                    dst.write(out[:decryptor.update_into(chunk[:n], out)])
+                dst.write(decryptor.finalize())
+            os.replace(tmp_path, dst_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _secure_delete(self, file_path: Path, paranoid: bool = False):
+        """Securely delete a file
+        
+        By default the file's blocks are discarded in place (hole punch on
+        Linux, FSCTL_SET_ZERO_DATA on Windows), falling back to one pass of
+        zeros. paranoid=True keeps the old three-pass random overwrite.
+        """
         try:
             # Get file size
             file_size = file_path.stat().st_size
 
-            # Overwrite file content with random data
-            with open(file_path, 'wb') as f:
-                # Overwrite 3 times
-                for _ in range(3):
-                    f.seek(0)
-                    f.write(os.urandom(file_size))
+            # Open without truncating so the existing blocks are overwritten
+            with open(file_path, 'r+b') as f:
+                if paranoid:
+                    for _ in range(3):
+                        f.seek(0)
+                        remaining = file_size
+                        while remaining > 0:
+                            chunk = min(remaining, len(_ZERO_BUFFER))
+                            f.write(os.urandom(chunk))
+                            remaining -= chunk
+                        f.flush()
+                        os.fsync(f.fileno())
+                elif not _deallocate_range(f.fileno(), file_size):
+                    zeros = memoryview(_ZERO_BUFFER)
+                    remaining = file_size
+                    while remaining > 0:
+                        chunk = min(remaining, len(zeros))
+                        f.write(zeros[:chunk])
+                        remaining -= chunk
                     f.flush()
                     os.fsync(f.fileno())
 
@@ -438,20 +1067,34 @@ class ScanEngine:
             self.logger.error(f"Error getting quarantine list: {e}")
             return []
 
+    def _build_heuristic_atoms(self):
+        """Compile heuristic rules and index them by their literal atoms"""
+        self._atom_rules: Dict[bytes, List[HeuristicRule]] = {}
+        self._atomless_rules: List[HeuristicRule] = []
+        for rule in self.heuristic_rules:
+            rule.compiled = re.compile(rule.pattern, re.IGNORECASE | re.ASCII)
+            if not rule.atoms:
+                self._atomless_rules.append(rule)
+            for atom in rule.atoms:
+                self._atom_rules.setdefault(atom.lower(), []).append(rule)
+        self._atom_regex = re.compile(
+            b'|'.join(re.escape(atom) for atom in self._atom_rules), re.IGNORECASE | re.ASCII
+        ) if self._atom_rules else None
+        
     def analyze_file_content(self, file_path: Path) -> List[Dict[str, any]]:
         """Analyze file content for suspicious patterns"""
         threats = []
         try:
-            # Skip very large files or binary files
-            if file_path.stat().st_size > 10_000_000:  # 10MB limit
-                return threats
-                
-            with open(file_path, 'r', errors='ignore') as f:
-                content = f.read()
-                
-            # Apply heuristic rules
+            with open(file_path, 'rb') as f:
+                # Skip very large files or empty files
+                size = os.fstat(f.fileno()).st_size
+                if not size or size > 10_000_000:  # 10MB limit
+                    return threats
+                    
+                matched = self._match_heuristics(f.read())
+                    
             for rule in self.heuristic_rules:
-                if re.search(rule.pattern, content, re.IGNORECASE):
+                if rule.name in matched:
                     threats.append({
                         'type': 'heuristic',
                         'rule_name': rule.name,
@@ -464,14 +1107,43 @@ class ScanEngine:
             
         return threats
 
+    def _match_heuristics(self, buf) -> Set[str]:
+        """Return the names of heuristic rules matching a raw byte buffer
+        
+        One pass over the buffer finds atom hits; each candidate rule's full
+        pattern is then confirmed only in a small window around the hit.
+        """
+        matched = set()
+        pending = len(self.heuristic_rules) - len(self._atomless_rules)
+        if self._atom_regex is not None:
+            for hit in self._atom_regex.finditer(buf):
+                start = max(0, hit.start() - 64)
+                window = buf[start:hit.end() + 64]
+                for rule in self._atom_rules[hit.group().lower()]:
+                    if rule.name not in matched and rule.compiled.search(window):
+                        matched.add(rule.name)
+                        pending -= 1
+                if not pending:
+                    break
+                    
+        for rule in self._atomless_rules:
+            if rule.compiled.search(buf):
+                matched.add(rule.name)
+        return matched
+        
     def analyze_process_behavior(self, pid: int) -> List[Dict[str, any]]:
         """Detailed process behavior analysis"""
         threats = []
         try:
-            process = psutil.Process(pid)
+            process = self._get_process(pid)
             
-            # Check CPU usage
-            if process.cpu_percent(interval=1.0) > 80:
+            # Check CPU usage from the background sampler. A process it hasn't
+            # reached yet was only just primed by _get_process, so a
+            # non-blocking read would cover microseconds and report ~0%
+            cpu = self._cpu_samples.get(pid)
+            if cpu is None:
+                cpu = process.cpu_percent(interval=FIRST_CPU_SAMPLE_INTERVAL)
+            if cpu > 80:
                 threats.append({
                     'type': 'behavior',
                     'name': 'high_cpu_usage',
@@ -507,105 +1179,6 @@ class ScanEngine:
             
         return threats
 
-    def scan_file(self, file_path: Path) -> Dict[str, any]:
-        """Scan a single file for threats"""
-        try:
-            if not file_path.exists() or not file_path.is_file():
-                return {
-                    'file_path': str(file_path),
-                    'status': 'error',
-                    'error': 'File not found or not accessible'
-                }
-                
-            threats = []
-            
-            # 1. Check file size
-            if file_path.stat().st_size > 100 * 1024 * 1024:  # Skip files > 100MB
-                return {
-                    'file_path': str(file_path),
-                    'status': 'skipped',
-                    'reason': 'File too large'
-                }
-                
-            # 2. Check file extension
-            if file_path.suffix.lower() in self.virus_signatures['suspicious_extensions']:
-                threats.append({
-                    'type': 'suspicious_extension',
-                    'details': f'Suspicious file extension: {file_path.suffix}',
-                    'severity': 3
-                })
-                
-            # 3. Calculate file hash
-            file_hash = self._calculate_file_hash(file_path)
-            if file_hash in self.virus_signatures['hashes']:
-                threats.append({
-                    'type': 'known_malware',
-                    'details': 'File matches known malware signature',
-                    'severity': 10
-                })
-                
-            # 4. Check file content
-            try:
-                # Get file type if magic is available
-                file_type = "unknown"
-                if HAS_MAGIC:
-                    file_type = magic.from_file(str(file_path))
-                else:
-                    # Basic file type detection based on extension
-                    file_type = file_path.suffix.lower()[1:] if file_path.suffix else "unknown"
-                
-                # Read file content for analysis
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                    
-                    # Check for suspicious patterns
-                    for pattern in self.virus_signatures['patterns']:
-                        if re.search(pattern, content):
-                            threats.append({
-                                'type': 'suspicious_pattern',
-                                'details': 'File contains suspicious code patterns',
-                                'severity': 7
-                            })
-                            break
-                    
-                    # Apply YARA rules if available
-                    if self.yara_compiler:
-                        matches = self.yara_compiler.match(data=content)
-                        for match in matches:
-                            threats.append({
-                                'type': 'yara_match',
-                                'details': f'Matched YARA rule: {match.rule}',
-                                'severity': 8
-                            })
-                            
-            except Exception as e:
-                self.logger.warning(f"Error analyzing file content: {e}")
-                
-            # Return scan results
-            return {
-                'file_path': str(file_path),
-                'status': 'infected' if threats else 'clean',
-                'threats': threats,
-                'hash': file_hash,
-                'file_type': file_type
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error scanning file {file_path}: {e}")
-            return {
-                'file_path': str(file_path),
-                'status': 'error',
-                'error': str(e)
-            }
-            
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of a file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
-
     async def scan_directory(self, directory: Path) -> List[Dict[str, any]]:
         """Enhanced scan_directory with memory optimization"""
         try:
@@ -613,9 +1186,16 @@ class ScanEngine:
             self.optimizer.reset_stats()
             self.stats = ScanStats(start_time=time.time())
             
-            # Collect files in batches to reduce memory usage
+            # Collect files in batches to reduce memory usage. The directory
+            # walk runs on the I/O thread pool, one batch ahead of the scans,
+            # so neither blocks the event loop or waits on the other
             results = []
-            for batch in self._get_file_batches(directory):
+            loop = asyncio.get_running_loop()
+            batches = self._get_file_batches(directory)
+            next_batch = loop.run_in_executor(self.executor, next, batches, None)
+            while (batch := await next_batch) is not None:
+                next_batch = loop.run_in_executor(self.executor, next, batches, None)
+                
                 # Process batch
                 batch_results = await self._scan_batch(batch)
                 results.extend(batch_results)
@@ -623,26 +1203,36 @@ class ScanEngine:
                 # Update progress
                 self.system_monitor.update_scan_progress(self.stats.files_scanned)
                 
-                # Force garbage collection between batches
-                gc.collect()
-                
-                # Add small delay to prevent resource exhaustion
-                await asyncio.sleep(0.01)
-                
             return results
             
         finally:
             self.system_monitor.set_scanning_state(False)
             
-    def _get_file_batches(self, directory: Path) -> Iterator[List[Path]]:
-        """Get files in batches to reduce memory usage"""
+    def _get_file_batches(self, directory: Path) -> Iterator[List[Tuple[Path, int, int]]]:
+        """Get (path, size, mtime_ns) entries in batches to reduce memory usage
+        
+        Applies ScanOptimizer.should_scan_file's rules: the walk prunes
+        skip_paths below directory, and directory's own path is checked once
+        here, so nothing is scanned under a root inside a skipped path.
+        """
+        skip_paths = self.optimizer.skip_paths
+        if any(part in skip_paths for part in directory.parts):
+            return
+        skip_extensions = self.optimizer.skip_extensions
         batch = []
-        for file_path in directory.rglob('*'):
-            if file_path.is_file() and self.optimizer.should_scan_file(file_path):
-                batch.append(file_path)
-                if len(batch) >= self.batch_size:
-                    yield batch
-                    batch = []
+        for entry in _walk_files(directory, skip_paths):
+            if os.path.splitext(entry.name)[1].lower() in skip_extensions:
+                continue
+            try:
+                # Symlinked files are scanned as their target, so size and
+                # mtime come from the target too
+                st = entry.stat()
+            except OSError:
+                continue
+            batch.append((Path(entry.path), st.st_size, st.st_mtime_ns))
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
         if batch:
             yield batch
 
@@ -740,43 +1330,105 @@ class ScanEngine:
         # Implement resource reduction logic here
         pass
         
-    async def _scan_batch(self, batch: List[Path]) -> List[Dict]:
-        """Process a batch of files with optimized scanning"""
+    async def _scan_batch(self, batch: List[Tuple[Path, int, int]]) -> List[Dict]:
+        """Process a batch of (path, size, mtime_ns) entries with optimized scanning"""
         results = []
         
-        # Use thread pool for parallel scanning
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            # Submit scan tasks
-            future_to_file = {
-                executor.submit(self.scan_file, file_path): file_path 
-                for file_path in batch
-            }
+        # Cached and oversized files are answered without a round trip to a worker
+        scans: List = [None] * len(batch)
+        to_scan = []
+        for i, (file_path, size, mtime_ns) in enumerate(batch):
+            cached = self.cache.get((str(file_path), mtime_ns, size))
+            if cached is not None:
+                scans[i] = cached
+            elif size > MAX_SCAN_SIZE:
+                scans[i] = _skipped_result(file_path)
+            else:
+                to_scan.append(i)
+                
+        # Deal the rest to the scan process pool in chunks rather than one
+        # task per file, so queue and IPC overhead scales with the chunk count.
+        # Several chunks per worker lets an idle worker take up chunks a busy
+        # one hasn't started yet
+        if to_scan:
+            if self._scan_pool_workers != self.max_threads:
+                # Throttling changed the thread cap since the pool was started
+                self._replace_scan_pool()
+            chunk_count = self._scan_pool_workers * SCAN_CHUNKS_PER_WORKER
+            chunk_size = -(-len(to_scan) // chunk_count)
+            chunks = [to_scan[i:i + chunk_size] for i in range(0, len(to_scan), chunk_size)]
+            chunk_results = await self._scan_chunks(
+                [[(str(batch[i][0]), batch[i][1]) for i in chunk] for chunk in chunks]
+            )
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                if isinstance(chunk_result, Exception):
+                    for i in chunk:
+                        scans[i] = chunk_result
+                else:
+                    for i, result in zip(chunk, chunk_result):
+                        scans[i] = result
+        
+        scanned_bytes = 0
+        for (file_path, size, mtime_ns), result in zip(batch, scans):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error scanning {file_path}: {result}")
+                results.append({
+                    'file_path': str(file_path),
+                    'status': 'error',
+                    'error': str(result)
+                })
+                self.stats.files_error += 1
+                continue
+                
+            results.append(result)
+            if result.get('status') in ('clean', 'infected'):
+                self.cache.put((str(file_path), mtime_ns, size), result)
+                scanned_bytes += size
             
-            # Process completed scans
-            for future in as_completed(future_to_file):
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    # Update scan stats
-                    self.stats.files_scanned += 1
-                    if result.get('threats'):
-                        self.stats.files_infected += 1
-                    if result.get('error'):
-                        self.stats.files_error += 1
-                        
-                except Exception as e:
-                    file_path = future_to_file[future]
-                    self.logger.error(f"Error scanning {file_path}: {e}")
-                    results.append({
-                        'file_path': str(file_path),
-                        'status': 'error',
-                        'error': str(e)
-                    })
-                    self.stats.files_error += 1
-                    
+            # Update scan stats
+            self.stats.files_scanned += 1
+            if result.get('threats'):
+                self.stats.files_infected += 1
+            if result.get('error'):
+                self.stats.files_error += 1
+                
+        # Sizes are known from the directory walk; account them once per batch
+        self.stats.bytes_scanned += scanned_bytes
+        self.performance_monitor.record_files(len(batch))
         return results
         
+    async def _scan_chunks(self, chunks: List[List[Tuple[str, int]]]) -> List:
+        """Scan chunks of (path, size) in the worker pool
+        
+        Returns each chunk's result list, or the exception it raised. A worker
+        that dies mid-scan breaks the whole pool, so the pool is replaced and
+        the chunks it failed are retried once; if they break the new pool too
+        they are scanned in-process instead.
+        """
+        loop = asyncio.get_running_loop()
+        
+        async def in_pool(chunk):
+            return await loop.run_in_executor(self.scan_pool, _scan_chunk_in_worker, chunk)
+            
+        async def in_process(chunk):
+            return await loop.run_in_executor(self.executor, self._scan_chunk_in_process, chunk)
+            
+        results = await asyncio.gather(*(in_pool(chunk) for chunk in chunks), return_exceptions=True)
+        for retry in (in_pool, in_process):
+            broken = [k for k, result in enumerate(results) if isinstance(result, BrokenProcessPool)]
+            if not broken:
+                break
+            self.logger.warning(f"Scan worker pool broke; restarting it and retrying {len(broken)} chunks")
+            self._replace_scan_pool()
+            retried = await asyncio.gather(*(retry(chunks[k]) for k in broken), return_exceptions=True)
+            for k, result in zip(broken, retried):
+                results[k] = result
+        return results
+        
+    def _scan_chunk_in_process(self, chunk: List[Tuple[str, int]]) -> List[Dict]:
+        """Scan a chunk with the engine's own FileScanner"""
+        return [self.scanner.scan_file(Path(path), size) for path, size in chunk]
+        
     def _cleanup_scan_data(self):
         """Clean up temporary scan data"""
         try:
@@ -786,14 +1438,17 @@ class ScanEngine:
             # Clear signature cache
             if hasattr(self, 'signature_cache'):
                 self.signature_cache.clear()
+                
+            # Drop cached scan results
+            self.cache.clear()
             
-            # Reset batch processing
+            # Reset batch processing in place, keeping the list for reuse
             if hasattr(self, 'current_batch'):
-                self.current_batch = []
+                del self.current_batch[:]
             
-            # Force garbage collection
-            import gc
-            gc.collect()
+            # No gc.collect() here: the system monitor runs a full collection
+            # around its cleanup handlers, and clearing these containers
+            # leaves nothing cyclic behind
             
         except Exception as e:
             self.logger.error(f"Error cleaning scan data: {e}")
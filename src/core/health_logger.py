@@ -1,6 +1,15 @@
+import atexit
+import heapq
 import logging
 import json
-from typing import Dict, List, Optional
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass, asdict
@@ -8,6 +17,53 @@ import psutil
 import platform
 from enum import Enum
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def _loads(data):
+    """Parse JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Appends between size checks for log rotation
+ROTATION_CHECK_INTERVAL = 100
+
+# Background writer: entries per append batch, how long to wait for a batch
+# to fill (seconds), and how many entries may be queued before dropping
+WRITE_BATCH_SIZE = 64
+WRITE_BATCH_WAIT = 0.05
+WRITE_QUEUE_SIZE = 10000
+
+def _epoch(entry: Dict, epoch_key: str, iso_key: str) -> float:
+    """Read a stored epoch time, parsing the ISO field for older entries"""
+    value = entry.get(epoch_key)
+    if value is None:
+        value = datetime.fromisoformat(entry[iso_key]).timestamp()
+    return value
+
+def _month_end(stamp: str) -> Optional[datetime]:
+    """Start of the month after the YYYYMM prefix of stamp, if it has one"""
+    try:
+        month = datetime.strptime(stamp[:6], '%Y%m')
+    except ValueError:
+        return None
+    return (month + timedelta(days=32)).replace(day=1)
+
+# Queries spanning several log files read them on up to this many threads;
+# set PARALLEL_READS to False to always read sequentially
+PARALLEL_READS = True
+PARALLEL_READ_WORKERS = 8
+
 class HealthLogLevel(Enum):
     """Health log severity levels"""
     INFO = "info"
@@ -41,10 +97,39 @@ class HealthLogger:
         
         # System info cache
         self._system_info = self._get_system_info()
+        self._system_info_json = _dumps(self._system_info)
+        
+        # Entries in the current log file, counted on first write, and
+        # appends since the file size was last checked
+        self._entry_count: Optional[int] = None
+        self._count_file: Optional[Path] = None
+        self._appends_since_check = 0
+        
+        # Byte offsets of the current file's entries by (level, category),
+        # covering the first _index_size bytes; persisted as a .idx sidecar
+        self._index: Dict[Tuple[str, str], List[int]] = {}
+        self._index_size = 0
+        
+        # Append descriptor for _count_file, kept open between batches
+        self._fd: Optional[int] = None
+        
+        # Resolutions per log file from its .res.jsonl sidecar, as
+        # (mtime_ns, {event id: resolution fields})
+        self._resolution_cache: Dict[Path, Tuple[int, Dict[str, Dict]]] = {}
         
         # Cleanup old logs on startup
         self._cleanup_old_logs()
         
+        # Entries are appended by a background writer in batches; the lock
+        # serializes it with rewrites and index reads
+        self._io_lock = threading.RLock()
+        self._queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="HealthLogWriter", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+        
     def log_health_event(self, level: HealthLogLevel, category: str, 
                         message: str, metrics: Dict):
         """Log a health event with current system metrics"""
@@ -72,79 +157,175 @@ class HealthLogger:
         except Exception as e:
             self.logger.error(f"Failed to log health event: {e}")
             
+    def flush(self, timeout: float = 5.0):
+        """Wait until every queued entry has been written"""
+        if not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+        
+    def close(self):
+        """Write pending entries, stop the writer and persist the index"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=5.0)
+        with self._io_lock:
+            self._save_index()
+            self._close_log_fd()
+            
+    def _close_log_fd(self):
+        """Close the append descriptor of the current log file, if open"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            
     def resolve_event(self, event_id: str, resolution_action: str):
-        """Mark a health event as resolved"""
+        """Mark a health event as resolved
+        
+        The resolution is appended to the log's .res.jsonl sidecar and
+        applied to the entry when history is read.
+        """
         try:
-            log_file = self._get_current_log_file()
-            if not log_file.exists():
-                return
-                
-            entries = json.loads(log_file.read_text())
-            
-            for entry in entries:
-                if entry.get('id') == event_id and not entry.get('resolved'):
-                    entry['resolved'] = True
-                    entry['resolution_time'] = datetime.now().isoformat()
-                    entry['resolution_action'] = resolution_action
-                    break
-                    
-            log_file.write_text(json.dumps(entries, indent=2))
+            now = datetime.now()
+            record = {
+                'id': event_id,
+                'resolution_time': now.isoformat(),
+                'resolution_epoch': now.timestamp(),
+                'resolution_action': resolution_action
+            }
+            with self._io_lock:
+                log_file = self._get_current_log_file()
+                if not log_file.exists():
+                    return
+                with self._resolution_file(log_file).open("ab") as f:
+                    f.write(_dumps(record) + b"\n")
             
         except Exception as e:
             self.logger.error(f"Failed to resolve health event: {e}")
             
     def get_health_history(self, days: int = 7, 
                           level: Optional[HealthLogLevel] = None,
-                          category: Optional[str] = None) -> List[Dict]:
-        """Get health event history with optional filtering"""
+                          category: Optional[str] = None,
+                          limit: Optional[int] = None) -> List[Dict]:
+        """Get health event history with optional filtering, newest first"""
+        self.flush()
         try:
-            history = []
             cutoff_date = datetime.now() - timedelta(days=days)
+            cutoff_epoch = cutoff_date.timestamp()
+            level_value = level.value if level else None
+            log_files = self._log_files_since(cutoff_date)
             
-            # Collect entries from all relevant log files
-            for log_file in self.log_dir.glob("health_*.json"):
-                try:
-                    entries = json.loads(log_file.read_text())
-                    for entry in entries:
-                        entry_time = datetime.fromisoformat(entry['timestamp'])
-                        
-                        if entry_time < cutoff_date:
-                            continue
-                            
-                        if level and entry['level'] != level.value:
-                            continue
-                            
-                        if category and entry['category'] != category:
-                            continue
-                            
-                        history.append(entry)
-                        
-                except Exception as e:
-                    self.logger.error(f"Error reading log file {log_file}: {e}")
-                    continue
-                    
-            return sorted(history, key=lambda x: x['timestamp'], reverse=True)
+            # Each file's matches, newest first
+            if PARALLEL_READS and len(log_files) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(PARALLEL_READ_WORKERS, len(log_files))
+                ) as executor:
+                    per_file = list(executor.map(
+                        lambda log_file: self._filtered_entries(
+                            log_file, cutoff_epoch, level_value, category
+                        ),
+                        log_files
+                    ))
+            else:
+                per_file = [
+                    self._filtered_entries(log_file, cutoff_epoch, level_value, category)
+                    for log_file in log_files
+                ]
+                
+            merged = heapq.merge(*per_file, key=lambda x: x['timestamp'], reverse=True)
+            return list(islice(merged, limit))
             
         except Exception as e:
             self.logger.error(f"Failed to get health history: {e}")
             return []
             
+    def _filtered_entries(self, log_file: Path, cutoff_epoch: float,
+                          level: Optional[str], category: Optional[str]) -> List[Dict]:
+        """Read one log file's matching entries, resolved and newest first"""
+        history = []
+        try:
+            if (level or category) and log_file.suffix == '.jsonl':
+                entries = self._read_indexed(log_file, level, category)
+            else:
+                entries = self._read_entries(log_file)
+            for entry in entries:
+                if _epoch(entry, 'ts_epoch', 'timestamp') < cutoff_epoch:
+                    continue
+                    
+                if level and entry['level'] != level:
+                    continue
+                    
+                if category and entry['category'] != category:
+                    continue
+                    
+                history.append(entry)
+                
+        except Exception as e:
+            self.logger.error(f"Error reading log file {log_file}: {e}")
+            
+        # Apply resolutions recorded after the entries were written
+        resolutions = self._read_resolutions(log_file)
+        if resolutions:
+            for entry in history:
+                resolution = resolutions.get(entry.get('id'))
+                if resolution is not None and not entry.get('resolved'):
+                    entry.update(resolution)
+                    entry['resolved'] = True
+                    
+        # Entries are appended in time order, so reversing a file's
+        # matches sorts them and the files only need merging
+        history.reverse()
+        return history
+        
     def get_health_summary(self, days: int = 7) -> Dict:
         """Generate summary of health events"""
         try:
             history = self.get_health_history(days)
             
+            # Accumulate every figure in a single pass over the history
+            level_counts = Counter()
+            category_counts = Counter()
+            issue_counts = Counter()
+            resolved = 0
+            resolution_total = 0.0
+            resolution_count = 0
+            
+            for entry in history:
+                category = entry['category']
+                level_counts[entry['level']] += 1
+                category_counts[category] += 1
+                issue_counts[(category, entry['message'])] += 1
+                
+                if not entry.get('resolved'):
+                    continue
+                resolved += 1
+                try:
+                    resolution_total += (_epoch(entry, 'resolution_epoch', 'resolution_time')
+                                         - _epoch(entry, 'ts_epoch', 'timestamp'))
+                    resolution_count += 1
+                except (ValueError, KeyError, TypeError):
+                    continue
+                    
             return {
                 'total_events': len(history),
                 'by_level': {
-                    'critical': sum(1 for e in history if e['level'] == 'critical'),
-                    'warning': sum(1 for e in history if e['level'] == 'warning'),
-                    'info': sum(1 for e in history if e['level'] == 'info')
+                    'critical': level_counts['critical'],
+                    'warning': level_counts['warning'],
+                    'info': level_counts['info']
                 },
-                'by_category': self._count_by_category(history),
-                'resolution_rate': self._calculate_resolution_rate(history),
-                'avg_resolution_time': self._calculate_avg_resolution_time(history),
-                'most_common_issues': self._get_most_common_issues(history)
+                'by_category': dict(category_counts),
+                'resolution_rate': (resolved / len(history)) * 100 if history else 0.0,
+                'avg_resolution_time': (resolution_total / resolution_count
+                                        if resolution_count else None),
+                'most_common_issues': [
+                    {
+                        'category': category,
+                        'message': message,
+                        'count': count
+                    }
+                    for (category, message), count in issue_counts.most_common(5)
+                ]
             }
             
         except Exception as e:
@@ -152,51 +333,267 @@ class HealthLogger:
             return {}
             
     def _write_log_entry(self, entry: HealthLogEntry):
-        """Write a health log entry to the current log file"""
+        """Queue a health log entry for the background writer"""
         try:
-            log_file = self._get_current_log_file()
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.logger.error("Health log queue full, dropping entry")
             
-            # Read existing entries
-            if log_file.exists():
-                entries = json.loads(log_file.read_text())
-            else:
-                entries = []
+    def _writer_loop(self):
+        """Drain queued entries and append them to the log in batches"""
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_WAIT
+            # Stop filling early at a flush or close marker
+            while len(batch) < WRITE_BATCH_SIZE and isinstance(batch[-1], HealthLogEntry):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+                    
+            entries = [item for item in batch if isinstance(item, HealthLogEntry)]
+            if entries:
+                self._write_batch(entries)
+            for item in batch:
+                if item is None:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+                    
+    def _write_batch(self, entries: List[HealthLogEntry]):
+        """Append a batch of health log entries to the current log file"""
+        try:
+            with self._io_lock:
+                log_file = self._get_current_log_file()
                 
-            # Add new entry
-            entries.append({
-                'id': f"{entry.timestamp.strftime('%Y%m%d%H%M%S')}_{len(entries)}",
-                'timestamp': entry.timestamp.isoformat(),
-                'level': entry.level.value,
-                'category': entry.category,
-                'message': entry.message,
-                'metrics': entry.metrics,
-                'system_info': entry.system_info,
-                'resolved': entry.resolved,
-                'resolution_time': entry.resolution_time.isoformat() 
-                                 if entry.resolution_time else None,
-                'resolution_action': entry.resolution_action
-            })
-            
-            # Write updated entries
-            log_file.write_text(json.dumps(entries, indent=2))
-            
-            # Check if rotation needed
-            if log_file.stat().st_size > self.max_log_size:
-                self._rotate_logs()
+                # Entry ids are numbered by position in the file, so count the
+                # existing lines once per file rather than on every write
+                if self._count_file != log_file:
+                    if self._count_file is not None:
+                        self._save_index()
+                    self._close_log_fd()
+                    self._load_index(log_file)
+                    self._count_file = log_file
+                if self._fd is None:
+                    self._fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                    
+                payloads = []
+                lines = []
+                for entry in entries:
+                    payload = {
+                        'id': f"{entry.timestamp.strftime('%Y%m%d%H%M%S')}_{self._entry_count}",
+                        'timestamp': entry.timestamp.isoformat(),
+                        'ts_epoch': entry.timestamp.timestamp(),
+                        'level': entry.level.value,
+                        'category': entry.category,
+                        'message': entry.message,
+                        'metrics': entry.metrics,
+                        'resolved': entry.resolved,
+                        'resolution_time': entry.resolution_time.isoformat() 
+                                         if entry.resolution_time else None,
+                        'resolution_action': entry.resolution_action
+                    }
+                    self._entry_count += 1
+                    payloads.append(payload)
+                    
+                    # The cached system info is serialized once and spliced
+                    # in as a pre-encoded fragment
+                    if entry.system_info is self._system_info:
+                        system_info_json = self._system_info_json
+                    else:
+                        system_info_json = _dumps(entry.system_info)
+                    lines.append(
+                        _dumps(payload)[:-1] + b',"system_info":' + system_info_json + b"}\n"
+                    )
+                    
+                # Append the whole batch as JSON lines in one write, then
+                # index each line's offset
+                offset = os.lseek(self._fd, 0, os.SEEK_END)
+                if hasattr(os, 'writev'):
+                    os.writev(self._fd, lines)
+                else:
+                    os.write(self._fd, b"".join(lines))
+                for payload, line in zip(payloads, lines):
+                    self._index.setdefault((payload['level'], payload['category']), []).append(offset)
+                    offset += len(line)
+                self._index_size = offset
                 
+                # Check if rotation is needed every ROTATION_CHECK_INTERVAL
+                # appends. The index is only persisted on close, month switch
+                # and rotation; rewriting it here would cost a full copy of
+                # every offset per check, and lines past its saved size are
+                # re-indexed on load anyway
+                self._appends_since_check += len(entries)
+                if self._appends_since_check >= ROTATION_CHECK_INTERVAL:
+                    self._appends_since_check = 0
+                    if log_file.stat().st_size > self.max_log_size:
+                        self._rotate_logs()
+                        
         except Exception as e:
-            self.logger.error(f"Failed to write health log entry: {e}")
+            self.logger.error(f"Failed to write health log entries: {e}")
             
+    def _log_files_since(self, cutoff_date: datetime) -> List[Path]:
+        """List log files that may hold entries at or after cutoff_date
+        
+        Files are named after the month they were written in, so months
+        ending before the cutoff are skipped without being opened.
+        """
+        log_files = []
+        with os.scandir(self.log_dir) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                if not name.startswith("health_") or not name.endswith((".json", ".jsonl")):
+                    continue
+                if name.endswith(".res.jsonl"):
+                    continue
+                month_end = _month_end(name[len("health_"):])
+                if month_end is not None and month_end <= cutoff_date:
+                    continue
+                log_files.append(Path(dir_entry.path))
+        return log_files
+        
     def _get_current_log_file(self) -> Path:
         """Get the current log file path"""
-        return self.log_dir / f"health_{datetime.now().strftime('%Y%m')}.json"
+        return self.log_dir / f"health_{datetime.now().strftime('%Y%m')}.jsonl"
+        
+    @staticmethod
+    def _resolution_file(log_file: Path) -> Path:
+        """Path of the resolution sidecar for a log file"""
+        return log_file.with_suffix('.res.jsonl')
+        
+    def _read_resolutions(self, log_file: Path) -> Dict[str, Dict]:
+        """Load a log file's resolutions by event id, keeping the first per id"""
+        res_file = self._resolution_file(log_file)
+        try:
+            mtime_ns = res_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        cached = self._resolution_cache.get(log_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+            
+        resolutions = {}
+        with res_file.open("rb") as f:
+            for line in f:
+                # A partially written last line is not a record yet
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    record = _loads(line)
+                    resolutions.setdefault(record.pop('id'), record)
+        self._resolution_cache[log_file] = (mtime_ns, resolutions)
+        return resolutions
+        
+    def _read_entries(self, log_file: Path) -> Iterator[Dict]:
+        """Yield entries from a JSONL log, or a legacy JSON array log"""
+        if log_file.suffix == '.json':
+            yield from _loads(log_file.read_bytes())
+            return
+        with log_file.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+                    
+    def _read_indexed(self, log_file: Path, level: Optional[str],
+                      category: Optional[str]) -> Iterator[Dict]:
+        """Yield entries that may match level/category, seeking via the index
+        
+        Falls back to a full read when the file has no index.
+        """
+        with self._io_lock:
+            if log_file == self._count_file:
+                index = {key: list(offsets) for key, offsets in self._index.items()}
+                indexed_size = self._index_size
+            else:
+                index = None
+        if index is None:
+            sidecar = self._read_index(log_file)
+            if sidecar is None:
+                yield from self._read_entries(log_file)
+                return
+            index = {(lvl, cat): offsets for lvl, cat, offsets in sidecar['keys']}
+            indexed_size = sidecar['size']
+            
+        offsets = sorted(
+            offset
+            for (lvl, cat), key_offsets in index.items()
+            if (level is None or lvl == level) and (category is None or cat == category)
+            for offset in key_offsets
+        )
+        with log_file.open("rb") as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield _loads(f.readline())
+                
+            # Lines appended after the index was last saved aren't in it
+            f.seek(indexed_size)
+            for line in f:
+                if line.strip():
+                    yield _loads(line)
+                    
+    def _read_index(self, log_file: Path) -> Optional[Dict]:
+        """Read a log file's .idx sidecar, or None if missing or stale"""
+        try:
+            sidecar = _loads(log_file.with_suffix('.idx').read_bytes())
+            if sidecar['size'] <= log_file.stat().st_size:
+                return sidecar
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+        
+    def _load_index(self, log_file: Path):
+        """Load the current file's index and entry count, indexing any new lines"""
+        self._index = {}
+        self._index_size = 0
+        self._entry_count = 0
+        if not log_file.exists():
+            return
+            
+        sidecar = self._read_index(log_file)
+        if sidecar is not None:
+            self._index = {(lvl, cat): offsets for lvl, cat, offsets in sidecar['keys']}
+            self._index_size = sidecar['size']
+            self._entry_count = sidecar['count']
+            
+        offset = self._index_size
+        with log_file.open("rb") as f:
+            f.seek(offset)
+            for line in f:
+                if line.strip():
+                    entry = _loads(line)
+                    self._index.setdefault((entry['level'], entry['category']), []).append(offset)
+                    self._entry_count += 1
+                offset += len(line)
+        self._index_size = offset
+        
+    def _save_index(self):
+        """Persist the current file's index to its .idx sidecar"""
+        if self._count_file is None:
+            return
+        try:
+            sidecar = self._count_file.with_suffix('.idx')
+            tmp_file = sidecar.with_suffix('.idx.tmp')
+            tmp_file.write_bytes(_dumps({
+                'size': self._index_size,
+                'count': self._entry_count,
+                'keys': [[lvl, cat, offsets] for (lvl, cat), offsets in self._index.items()]
+            }))
+            os.replace(tmp_file, sidecar)
+        except Exception as e:
+            self.logger.error(f"Failed to save health log index: {e}")
         
     def _cleanup_old_logs(self):
         """Clean up log files older than max_log_days"""
         try:
             cutoff_date = datetime.now() - timedelta(days=self.max_log_days)
             
-            for log_file in self.log_dir.glob("health_*.json"):
+            for log_file in self.log_dir.glob("health_*.json*"):
+                if log_file.name.endswith(".res.jsonl"):
+                    continue
                 try:
                     # Extract date from filename
                     file_date = datetime.strptime(
@@ -206,6 +603,8 @@ class HealthLogger:
                     
                     if file_date < cutoff_date:
                         log_file.unlink()
+                        log_file.with_suffix('.idx').unlink(missing_ok=True)
+                        self._resolution_file(log_file).unlink(missing_ok=True)
                         
                 except (ValueError, IndexError):
                     continue
@@ -222,10 +621,20 @@ class HealthLogger:
                 
             # Create new filename with timestamp
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            new_file = self.log_dir / f"health_{timestamp}.json"
+            new_file = self.log_dir / f"health_{timestamp}.jsonl"
             
-            # Rename current file
+            # Rename current file along with its index
+            if self._count_file == current_file:
+                self._save_index()
+            self._close_log_fd()
             current_file.rename(new_file)
+            index_file = current_file.with_suffix('.idx')
+            if index_file.exists():
+                index_file.rename(new_file.with_suffix('.idx'))
+            res_file = self._resolution_file(current_file)
+            if res_file.exists():
+                res_file.rename(self._resolution_file(new_file))
+            self._count_file = None
             
             # Cleanup old files if needed
             self._cleanup_old_logs()
@@ -256,61 +665,3 @@ class HealthLogger:
         except Exception as e:
             self.logger.error(f"Failed to get system info: {e}")
             return {}
-            
-    def _count_by_category(self, history: List[Dict]) -> Dict:
-        """Count events by category"""
-        categories = {}
-        for entry in history:
-            category = entry['category']
-            categories[category] = categories.get(category, 0) + 1
-        return categories
-        
-    def _calculate_resolution_rate(self, history: List[Dict]) -> float:
-        """Calculate percentage of resolved events"""
-        if not history:
-            return 0.0
-        resolved = sum(1 for e in history if e.get('resolved', False))
-        return (resolved / len(history)) * 100
-        
-    def _calculate_avg_resolution_time(self, history: List[Dict]) -> Optional[float]:
-        """Calculate average time to resolve issues"""
-        resolution_times = []
-        
-        for entry in history:
-            if not entry.get('resolved'):
-                continue
-                
-            try:
-                start_time = datetime.fromisoformat(entry['timestamp'])
-                end_time = datetime.fromisoformat(entry['resolution_time'])
-                duration = (end_time - start_time).total_seconds()
-                resolution_times.append(duration)
-            except (ValueError, KeyError):
-                continue
-                
-        if not resolution_times:
-            return None
-            
-        return sum(resolution_times) / len(resolution_times)
-        
-    def _get_most_common_issues(self, history: List[Dict], limit: int = 5) -> List[Dict]:
-        """Get most frequently occurring issues"""
-        issues = {}
-        for entry in history:
-            key = (entry['category'], entry['message'])
-            issues[key] = issues.get(key, 0) + 1
-            
-        sorted_issues = sorted(
-            issues.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:limit]
-        
-        return [
-            {
-                'category': category,
-                'message': message,
-                'count': count
-            }
-            for (category, message), count in sorted_issues
-        ] 
\ No newline at end of file
@@ -1,10 +1,45 @@
+import atexit
 import json
 import logging
-from datetime import datetime
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def _loads(data):
+    """Parse JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Queries spanning several log files read them on up to this many threads;
+# set PARALLEL_READS to False to always read sequentially
+PARALLEL_READS = True
+PARALLEL_READ_WORKERS = 8
+
+def _month_end(stamp: str) -> Optional[datetime]:
+    """Start of the month after the YYYYMM prefix of stamp, if it has one"""
+    try:
+        month = datetime.strptime(stamp[:6], '%Y%m')
+    except ValueError:
+        return None
+    return (month + timedelta(days=32)).replace(day=1)
+
 @dataclass
 class ThreatEvent:
     """Container for threat detection events"""
@@ -16,6 +51,7 @@ class ThreatEvent:
     quarantine_id: Optional[str]
     scan_type: str  # 'real-time', 'scheduled', 'manual'
     details: Dict
+    ts_epoch: Optional[float] = None  # timestamp as epoch seconds, set when stored
 
 class HistoryManager:
     """Manages threat detection history"""
@@ -24,17 +60,25 @@ class HistoryManager:
         self.logger = logging.getLogger(__name__)
         self.base_path = base_path
         self.history_dir = base_path / "history"
-        self.current_log = self.history_dir / f"threat_log_{datetime.now().strftime('%Y%m')}.json"
+        self.current_log = self.history_dir / f"threat_log_{datetime.now().strftime('%Y%m')}.jsonl"
+        
+        # Append descriptor for current_log, reopened when the month changes
+        self._fd: Optional[int] = None
+        self._fd_month: Optional[str] = None
+        
+        # Parsed entries of the current log as (mtime_ns, bytes consumed, entries);
+        # older months are streamed from disk instead
+        self._parse_cache: Dict[Path, Tuple[int, int, List[Dict]]] = {}
         
         # Initialize storage
         self._init_storage()
+        atexit.register(self.close)
         
     def _init_storage(self):
         """Initialize history storage"""
         try:
             self.history_dir.mkdir(parents=True, exist_ok=True)
-            if not self.current_log.exists():
-                self.current_log.write_text("[]")
+            self.current_log.touch(exist_ok=True)
         except Exception as e:
             self.logger.critical(f"Failed to initialize history storage: {e}")
             raise
@@ -42,94 +86,212 @@ class HistoryManager:
     def add_event(self, event: ThreatEvent):
         """Add a new threat event to history"""
         try:
-            events = self._load_current_log()
-            events.append(asdict(event))
-            self._save_current_log(events)
+            if event.ts_epoch is None:
+                event.ts_epoch = datetime.fromisoformat(event.timestamp).timestamp()
+            self._append_to_current_log(asdict(event))
             self.logger.info(f"Added threat event: {event.threat_type} in {event.file_path}")
         except Exception as e:
             self.logger.error(f"Failed to add threat event: {e}")
             
+    def close(self):
+        """Close the current log's append descriptor"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            
     def get_events(self, start_date: Optional[datetime] = None,
                   end_date: Optional[datetime] = None,
                   threat_type: Optional[str] = None,
                   min_severity: Optional[int] = None) -> List[ThreatEvent]:
         """Get threat events with optional filtering"""
         try:
-            all_events = []
+            return [
+                ThreatEvent(**event)
+                for event in self._get_events_raw(start_date, end_date, threat_type, min_severity)
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to get threat events: {e}")
+            return []
+        
+    def _get_events_raw(self, start_date: Optional[datetime] = None,
+                        end_date: Optional[datetime] = None,
+                        threat_type: Optional[str] = None,
+                        min_severity: Optional[int] = None) -> Iterator[Dict]:
+        """Yield matching threat events as stored dicts, which must not be modified"""
+        try:
+            start_epoch = start_date.timestamp() if start_date else None
+            end_epoch = end_date.timestamp() if end_date else None
+            filters = (start_epoch, end_epoch, threat_type, min_severity)
+            log_files = self._log_files_between(start_date, end_date)
             
-            # Collect events from all log files
-            for log_file in self.history_dir.glob("threat_log_*.json"):
-                events = self._load_log(log_file)
-                all_events.extend(events)
-                
-            # Apply filters
-            filtered_events = []
-            for event in all_events:
-                event_time = datetime.fromisoformat(event['timestamp'])
-                
-                if start_date and event_time < start_date:
-                    continue
-                if end_date and event_time > end_date:
-                    continue
-                if threat_type and event['threat_type'] != threat_type:
-                    continue
-                if min_severity and event['severity'] < min_severity:
-                    continue
+            if PARALLEL_READS and len(log_files) > 1:
+                # Read and filter files concurrently, then emit in month order
+                with ThreadPoolExecutor(
+                    max_workers=min(PARALLEL_READ_WORKERS, len(log_files))
+                ) as executor:
+                    for events in executor.map(
+                        lambda log_file: list(self._filter_log(log_file, *filters)),
+                        log_files
+                    ):
+                        yield from events
+            else:
+                for log_file in log_files:
+                    yield from self._filter_log(log_file, *filters)
                     
-                filtered_events.append(ThreatEvent(**event))
-                
-            return filtered_events
-            
         except Exception as e:
             self.logger.error(f"Failed to get threat events: {e}")
-            return []
+            
+    def _filter_log(self, log_file: Path, start_epoch: Optional[float],
+                    end_epoch: Optional[float], threat_type: Optional[str],
+                    min_severity: Optional[int]) -> Iterator[Dict]:
+        """Yield one log file's events that pass the filters"""
+        # Events are appended in write order, which needn't be time order,
+        # so every line is checked against the whole date range
+        for event in self._iter_entries(log_file):
+            # Events written before ts_epoch was stored need their ISO time parsed
+            event_epoch = event.get('ts_epoch')
+            if event_epoch is None:
+                event_epoch = datetime.fromisoformat(event['timestamp']).timestamp()
+                
+            if start_epoch is not None and event_epoch < start_epoch:
+                continue
+            if end_epoch is not None and event_epoch > end_epoch:
+                continue
+            if threat_type and event['threat_type'] != threat_type:
+                continue
+            if min_severity and event['severity'] < min_severity:
+                continue
+                
+            yield event
             
     def get_statistics(self, start_date: Optional[datetime] = None,
                       end_date: Optional[datetime] = None) -> Dict:
         """Get threat detection statistics"""
-        events = self.get_events(start_date, end_date)
-        
-        stats = {
-            'total_threats': len(events),
-            'by_type': {},
-            'by_severity': {i: 0 for i in range(1, 11)},
-            'quarantined': sum(1 for e in events if e.quarantine_id),
+        # Accumulate every figure in a single pass over the raw events
+        total = 0
+        by_type = Counter()
+        by_severity = Counter()
+        scan_types = Counter()
+        quarantined = 0
+        for event in self._get_events_raw(start_date, end_date):
+            total += 1
+            by_type[event['threat_type']] += 1
+            by_severity[event['severity']] += 1
+            scan_types[event['scan_type']] += 1
+            if event['quarantine_id']:
+                quarantined += 1
+                
+        return {
+            'total_threats': total,
+            'by_type': dict(by_type),
+            'by_severity': {**{i: 0 for i in range(1, 11)}, **by_severity},
+            'quarantined': quarantined,
             'scan_types': {
                 'real-time': 0,
                 'scheduled': 0,
-                'manual': 0
+                'manual': 0,
+                **scan_types
             }
         }
         
-        for event in events:
-            # Count by type
-            stats['by_type'][event.threat_type] = \
-                stats['by_type'].get(event.threat_type, 0) + 1
-            
-            # Count by severity
-            stats['by_severity'][event.severity] += 1
-            
-            # Count by scan type
-            stats['scan_types'][event.scan_type] += 1
-            
-        return stats
-        
     def _load_current_log(self) -> List[Dict]:
         """Load current month's threat log"""
         return self._load_log(self.current_log)
         
+    def _log_files_between(self, start_date: Optional[datetime],
+                           end_date: Optional[datetime]) -> List[Path]:
+        """List log files in month order, skipping months outside the range
+        
+        The month is read from the file name, so skipped files are never opened.
+        """
+        log_files = []
+        with os.scandir(self.history_dir) as it:
+            for dir_entry in it:
+                name = dir_entry.name
+                if not name.startswith("threat_log_") or not name.endswith((".json", ".jsonl")):
+                    continue
+                stamp = name[len("threat_log_"):]
+                month_end = _month_end(stamp)
+                if month_end is not None:
+                    if start_date and month_end <= start_date:
+                        continue
+                    if end_date and datetime.strptime(stamp[:6], '%Y%m') > end_date:
+                        continue
+                log_files.append(Path(dir_entry.path))
+        return sorted(log_files, key=lambda p: p.stem)
+        
+    def _iter_entries(self, log_file: Path) -> Iterator[Dict]:
+        """Yield a log file's entries, from the parse cache for the current log"""
+        if log_file == self.current_log:
+            return iter(self._load_log(log_file))
+        return self._iter_log(log_file)
+                
+    def _iter_log(self, log_file: Path) -> Iterator[Dict]:
+        """Stream entries from a log file without keeping them in memory"""
+        try:
+            if log_file.suffix == '.json':
+                yield from _loads(log_file.read_bytes())
+                return
+                
+            with log_file.open("rb") as f:
+                for line in f:
+                    # A partially written last line is not an entry yet
+                    if not line.endswith(b"\n"):
+                        break
+                    if line.strip():
+                        yield _loads(line)
+        except Exception as e:
+            self.logger.error(f"Failed to load threat log {log_file}: {e}")
+            
     def _load_log(self, log_file: Path) -> List[Dict]:
-        """Load threat log from file"""
+        """Load threat log from a JSONL file, or a legacy JSON array file
+        
+        Parsed entries are cached per file and reused while its mtime is
+        unchanged. When a JSONL file has grown, only the appended lines are
+        parsed. The returned list is shared and must not be modified.
+        """
         try:
-            return json.loads(log_file.read_text())
+            st = log_file.stat()
+            mtime_ns = st.st_mtime_ns
+            cached = self._parse_cache.get(log_file)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[2]
+                
+            if log_file.suffix == '.json':
+                entries = _loads(log_file.read_bytes())
+                self._parse_cache[log_file] = (mtime_ns, 0, entries)
+                return entries
+                
+            # Continue from the cached offset unless the file was replaced or shrank
+            if cached is not None and 0 < cached[1] <= st.st_size:
+                offset, entries = cached[1], cached[2]
+            else:
+                offset, entries = 0, []
+            with log_file.open("rb") as f:
+                f.seek(offset)
+                for line in f:
+                    # Stop at a partially written last line; it's parsed next time
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    if line.strip():
+                        entries.append(_loads(line))
+            self._parse_cache[log_file] = (mtime_ns, offset, entries)
+            return entries
         except Exception as e:
             self.logger.error(f"Failed to load threat log {log_file}: {e}")
             return []
             
-    def _save_current_log(self, events: List[Dict]):
-        """Save events to current month's log"""
+    def _append_to_current_log(self, event: Dict):
+        """Append one event as a JSON line to current month's log"""
         try:
-            self.current_log.write_text(json.dumps(events, indent=2))
+            month = datetime.now().strftime('%Y%m')
+            if self._fd is None or month != self._fd_month:
+                self.close()
+                self.current_log = self.history_dir / f"threat_log_{month}.jsonl"
+                self._fd = os.open(self.current_log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                self._fd_month = month
+            os.write(self._fd, _dumps(event) + b"\n")
         except Exception as e:
             self.logger.error(f"Failed to save threat log: {e}")
             raise 
\ No newline at end of file
@@ -1,21 +1,57 @@
+import sys
 import time
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
 from collections import deque
-from dataclasses import dataclass
-from statistics import mean, median
+from dataclasses import dataclass, field
 
-@dataclass
+try:
+    from sortedcontainers import SortedList
+    HAS_SORTEDCONTAINERS = True
+except ImportError:
+    HAS_SORTEDCONTAINERS = False
+
+class _SortedDurations:
+    """Minimal sorted multiset of floats used when sortedcontainers is missing"""
+    
+    def __init__(self):
+        self._items: List[float] = []
+        
+    def add(self, value: float):
+        insort(self._items, value)
+        
+    def remove(self, value: float):
+        del self._items[bisect_left(self._items, value)]
+        
+    def clear(self):
+        self._items.clear()
+        
+    def __getitem__(self, index: int) -> float:
+        return self._items[index]
+        
+    def __len__(self) -> int:
+        return len(self._items)
+
+@dataclass(slots=True)
 class LatencyRecord:
     """Container for latency measurements"""
     operation: str
     start_time: float
     end_time: float
     file_path: str
+    duration: float = field(init=False)  # Milliseconds
     
-    @property
-    def duration(self) -> float:
-        return (self.end_time - self.start_time) * 1000  # Convert to milliseconds
+    def __post_init__(self):
+        self.duration = (self.end_time - self.start_time) * 1000
+        
+    def reset(self, operation: str, start_time: float, end_time: float, file_path: str):
+        """Reuse this record for a new measurement"""
+        self.operation = operation
+        self.start_time = start_time
+        self.end_time = end_time
+        self.file_path = file_path
+        self.duration = (end_time - start_time) * 1000
 
 class LatencyMonitor:
     """Monitors and manages operation latency"""
@@ -25,33 +61,63 @@ class LatencyMonitor:
         self.max_latency = max_latency  # Maximum allowed latency in milliseconds
         self.history_size = 1000  # Keep last 1000 measurements
         self.latency_history = deque(maxlen=self.history_size)
-        self.current_operations: Dict[str, float] = {}
+        self.current_operations: Dict[Tuple[str, str], float] = {}
+        
+        # Running statistics over latency_history, kept in step on every
+        # append/eviction so get_statistics never rescans the history
+        self._durations = SortedList() if HAS_SORTEDCONTAINERS else _SortedDurations()
+        self._duration_sum = 0.0
+        self._violations = 0
+        
+        # Records released by clear_history, reused before allocating new ones
+        self._pool: List[LatencyRecord] = []
         
     def start_operation(self, operation: str, file_path: str):
         """Start timing an operation"""
-        operation_id = f"{operation}:{file_path}"
-        self.current_operations[operation_id] = time.perf_counter()
+        # Operation names are a small fixed set, so intern them and key by
+        # tuple rather than building a joined string per call
+        self.current_operations[(sys.intern(operation), file_path)] = time.perf_counter()
         
     def end_operation(self, operation: str, file_path: str) -> Optional[float]:
         """End timing an operation and record latency"""
-        operation_id = f"{operation}:{file_path}"
-        start_time = self.current_operations.pop(operation_id, None)
+        start_time = self.current_operations.pop((operation, file_path), None)
         
         if start_time is None:
             return None
             
         end_time = time.perf_counter()
-        record = LatencyRecord(operation, start_time, end_time, file_path)
+        
+        # Once the history is full, recycle the record being evicted
+        if len(self.latency_history) == self.history_size:
+            record = self.latency_history.popleft()
+            self._discard_stats(record.duration)
+            record.reset(operation, start_time, end_time, file_path)
+        elif self._pool:
+            record = self._pool.pop()
+            record.reset(operation, start_time, end_time, file_path)
+        else:
+            record = LatencyRecord(operation, start_time, end_time, file_path)
+        duration = record.duration
         self.latency_history.append(record)
+        self._durations.add(duration)
+        self._duration_sum += duration
         
         # Log if latency exceeds threshold
-        if record.duration > self.max_latency:
+        if duration > self.max_latency:
+            self._violations += 1
             self.logger.warning(
-                f"High latency detected: {record.duration:.2f}ms for {operation} "
+                f"High latency detected: {duration:.2f}ms for {operation} "
                 f"on {file_path}"
             )
             
-        return record.duration
+        return duration
+        
+    def _discard_stats(self, duration: float):
+        """Remove an evicted duration from the running statistics"""
+        self._durations.remove(duration)
+        self._duration_sum -= duration
+        if duration > self.max_latency:
+            self._violations -= 1
         
     def get_statistics(self) -> Dict:
         """Get latency statistics"""
@@ -65,16 +131,21 @@ class LatencyMonitor:
                 'total_operations': 0
             }
             
-        durations = [r.duration for r in self.latency_history]
-        violations = sum(1 for d in durations if d > self.max_latency)
+        durations = self._durations
+        count = len(durations)
+        middle = count // 2
+        if count % 2:
+            median = durations[middle]
+        else:
+            median = (durations[middle - 1] + durations[middle]) / 2
         
         return {
-            'average': mean(durations),
-            'median': median(durations),
-            'min': min(durations),
-            'max': max(durations),
-            'violations': violations,
-            'total_operations': len(durations)
+            'average': self._duration_sum / count,
+            'median': median,
+            'min': durations[0],
+            'max': durations[-1],
+            'violations': self._violations,
+            'total_operations': count
         }
         
     def get_violation_details(self) -> List[Dict]:
@@ -92,5 +163,9 @@ class LatencyMonitor:
         
     def clear_history(self):
         """Clear latency history"""
+        self._pool.extend(self.latency_history)
         self.latency_history.clear()
-        self.current_operations.clear() 
\ No newline at end of file
+        self.current_operations.clear()
+        self._durations.clear()
+        self._duration_sum = 0.0
+        self._violations = 0 
\ No newline at end of file
@@ -1,17 +1,166 @@
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from dataclasses import asdict, dataclass
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy as np
 from .performance_monitor import PerformanceMonitor
 
-@dataclass
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(',', ':'), default=float).encode()
+
+def _loads(data):
+    """Parse JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# numba and bottleneck take a few hundred ms to import, so they're loaded by
+# _load_accelerators on the first analysis; both flags stay None until then
+HAS_NUMBA: Optional[bool] = None
+HAS_BOTTLENECK: Optional[bool] = None
+_accelerators_lock = threading.Lock()
+
+# Each metric's pattern checks run on their own thread once a series is long
+# enough for NumPy's GIL-free reductions to outweigh the thread handoff; set
+# PARALLEL_ANALYSIS to False to always analyze sequentially
+PARALLEL_ANALYSIS = True
+PARALLEL_ANALYSIS_MIN_SAMPLES = 100000
+
+# Trend and variance checks run on means of this many samples (one minute at
+# the scanning sample rate); spikes are still found in the raw samples
+DOWNSAMPLE_FACTOR = 60
+
+# Share of samples over an absolute limit (cpu_high, memory_high) at which
+# the load counts as sustained; spike detection is relative to the series
+# itself, so a series that stays high has no spikes
+SUSTAINED_SHARE = 0.5
+
+# Series reductions, switched to bottleneck's single-pass C kernels when available
+_nanmean, _nanmax, _nanmin = np.nanmean, np.nanmax, np.nanmin
+
+def _find_spikes(values: np.ndarray, alpha: float) -> int:
+    """Count samples standing clear of the rest of a series
+    
+    Sorts the series in descending order and looks for a gap between
+    neighbouring values wider than alpha times the interquartile range in
+    its upper half; every sample above the lowest such gap is a spike. This
+    adapts to the series' own scale instead of relying on a fixed limit.
+    For a near-constant series the mean gap stands in for the range.
+    """
+    if values.size < 3:
+        return 0
+    ordered = np.sort(values)[::-1]
+    gaps = ordered[:-1] - ordered[1:]
+    q75, q25 = np.percentile(values, [75, 25])
+    scale = q75 - q25 if q75 > q25 else gaps.mean()
+    if not scale > 0:
+        return 0
+    wide = np.flatnonzero(gaps[:gaps.size // 2] > alpha * scale)
+    return int(wide[-1]) + 1 if wide.size else 0
+
+def _share_above(values: np.ndarray, limit: float) -> float:
+    """Fraction of samples above limit"""
+    if not values.size:
+        return 0.0
+    return np.count_nonzero(values > limit) / values.size
+
+def _downsample(values: np.ndarray, factor: int) -> np.ndarray:
+    """Means of consecutive blocks of factor samples
+    
+    Leftover samples are dropped from the start, so the newest samples always
+    count. Series shorter than two blocks are returned unchanged.
+    """
+    n = values.size
+    if factor <= 1 or n < 2 * factor:
+        return values
+    return values[n % factor:].reshape(-1, factor).mean(axis=1)
+
+def _variance(values: np.ndarray) -> float:
+    """Population variance from one pass of sums, as E[x^2] - E[x]^2"""
+    n = values.size
+    if not n:
+        return 0.0
+    mean = float(values.sum()) / n
+    mean_sq = float(np.dot(values, values)) / n
+    # Cancellation can leave a tiny negative result for near-constant series
+    return max(mean_sq - mean * mean, 0.0)
+
+def _slope_over_mean(y: np.ndarray) -> float:
+    """Least-squares slope of y against its index, divided by the mean of y
+    
+    Uses the closed form for x = 0..n-1, so no design matrix is built.
+    """
+    n = y.size
+    if n < 2:
+        return 0.0
+    sx = n * (n - 1) / 2
+    sxx = (n - 1) * n * (2 * n - 1) / 6
+    sy = float(y.sum())
+    sxy = float(np.dot(np.arange(n, dtype=np.float64), y))
+    mean = sy / n
+    slope = (sxy - sx * mean) / (sxx - sx * sx / n)
+    return slope / mean if mean else 0.0
+
+def _slope_over_mean_loop(y):
+    """Loop form of _slope_over_mean for numba to compile"""
+    n = y.size
+    if n < 2:
+        return 0.0
+    sx = n * (n - 1) / 2
+    sxx = (n - 1) * n * (2 * n - 1) / 6
+    sy = 0.0
+    sxy = 0.0
+    for i in range(n):
+        sy += y[i]
+        sxy += i * y[i]
+    mean = sy / n
+    slope = (sxy - sx * mean) / (sxx - sx * sx / n)
+    return slope / mean if mean else 0.0
+
+def _load_accelerators():
+    """Import numba and bottleneck, once, and switch to their kernels"""
+    global HAS_NUMBA, HAS_BOTTLENECK, _nanmean, _nanmax, _nanmin, _slope_over_mean
+    if HAS_NUMBA is not None:
+        return
+    with _accelerators_lock:
+        if HAS_NUMBA is not None:
+            return
+            
+        try:
+            import bottleneck as bn
+            _nanmean, _nanmax, _nanmin = bn.nanmean, bn.nanmax, bn.nanmin
+            HAS_BOTTLENECK = True
+        except ImportError:
+            HAS_BOTTLENECK = False
+            
+        try:
+            from numba import njit
+            slope_over_mean = njit(cache=True, fastmath=True, nogil=True)(_slope_over_mean_loop)
+            # Compile now rather than inside a pattern check thread
+            slope_over_mean(np.zeros(16, np.float64))
+            _slope_over_mean = slope_over_mean
+            HAS_NUMBA = True
+        except ImportError:
+            HAS_NUMBA = False
+
+@dataclass(slots=True, frozen=True)
 class PerformancePattern:
     """Container for identified performance patterns"""
     metric: str
-    pattern_type: str  # 'spike', 'trend', 'periodic'
+    pattern_type: str  # 'spike', 'sustained', 'trend', 'periodic'
     severity: int  # 1-10
     description: str
     recommendation: str
@@ -26,23 +175,32 @@ class PerformanceAnalyzer:
         self.analysis_dir = Path("data/analysis")
         self.analysis_dir.mkdir(parents=True, exist_ok=True)
         
+        # Analyses are appended as JSON lines to one log per day
+        self._analysis_log: Optional[BinaryIO] = None
+        self._analysis_log_date: Optional[date] = None
+        
         # Performance thresholds
         self.thresholds = {
             'cpu_high': 70.0,
             'memory_high': 512,  # MB
             'io_high': 50.0,  # MB/s
             'scan_speed_low': 800,  # files/sec
-            'latency_high': 80.0  # ms
+            'latency_high': 80.0,  # ms
+            'spike_gap': 3.0,  # gap, in interquartile ranges, that separates spikes
+            'scan_speed_variance': 10000  # (files/sec)^2
         }
         
     def analyze_performance(self, duration: timedelta = timedelta(days=7)) -> Dict:
         """Analyze performance metrics and generate recommendations"""
         try:
+            _load_accelerators()
+            
             # Get historical metrics
             metrics = self.performance_monitor.get_metrics_history(duration)
+            series = self._metrics_to_arrays(metrics)
             
             # Identify patterns
-            patterns = self._identify_patterns(metrics)
+            patterns = self._identify_patterns(series)
             
             # Generate recommendations
             recommendations = self._generate_recommendations(patterns)
@@ -59,7 +217,7 @@ class PerformanceAnalyzer:
                 'patterns': [self._pattern_to_dict(p) for p in patterns],
                 'recommendations': recommendations,
                 'optimization_score': optimization_score,
-                'metrics_summary': self._generate_metrics_summary(metrics)
+                'metrics_summary': self._generate_metrics_summary(series)
             }
             
             # Save analysis
@@ -71,28 +229,89 @@ class PerformanceAnalyzer:
             self.logger.error(f"Performance analysis failed: {e}")
             return {}
             
-    def _identify_patterns(self, metrics: List[Dict]) -> List[PerformancePattern]:
-        """Identify performance patterns in metrics"""
-        patterns = []
+    def _metrics_to_arrays(self, metrics: List[Dict]) -> Dict[str, np.ndarray]:
+        """Extract the analyzed metric series into arrays in a single pass"""
+        n = len(metrics)
+        cpu_usage = np.empty(n, np.float64)
+        memory_usage = np.empty(n, np.float64)
+        scan_speed = np.empty(n, np.float64)
+        for i, m in enumerate(metrics):
+            cpu_usage[i] = m['cpu_usage']
+            memory_usage[i] = m['memory_usage']
+            scan_speed[i] = m.get('scan_speed', 0)
+        return {'cpu': cpu_usage, 'memory': memory_usage, 'scan_speed': scan_speed}
         
-        # Extract metric series
-        cpu_usage = [m['cpu_usage'] for m in metrics]
-        memory_usage = [m['memory_usage'] for m in metrics]
-        scan_speed = [m.get('scan_speed', 0) for m in metrics]
+    def _identify_patterns(self, series: Dict[str, np.ndarray]) -> List[PerformancePattern]:
+        """Identify performance patterns in metric series"""
+        checks = (self._cpu_patterns, self._memory_patterns, self._scan_speed_patterns)
+        if PARALLEL_ANALYSIS and series['cpu'].size >= PARALLEL_ANALYSIS_MIN_SAMPLES:
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                results = list(executor.map(lambda check: check(series), checks))
+        else:
+            results = [check(series) for check in checks]
+        return [pattern for result in results for pattern in result]
+        
+    def _cpu_patterns(self, series: Dict[str, np.ndarray]) -> List[PerformancePattern]:
+        """Identify CPU usage patterns"""
+        patterns = []
         
-        # Check for CPU spikes
-        if any(cpu > self.thresholds['cpu_high'] for cpu in cpu_usage):
+        # Check for spikes relative to the series' own spread
+        cpu_spikes = _find_spikes(series['cpu'], self.thresholds['spike_gap'])
+        if cpu_spikes:
             patterns.append(PerformancePattern(
                 metric='cpu',
                 pattern_type='spike',
-                severity=8,
-                description="Frequent CPU usage spikes detected",
+                severity=min(10, 1 + cpu_spikes),
+                description=f"CPU usage spikes detected ({cpu_spikes} samples)",
                 recommendation="Consider reducing scan thread count or adjusting scan frequency",
                 impact=0.3
             ))
             
-        # Check for memory trends
-        memory_trend = self._calculate_trend(memory_usage)
+        # Check for usage held above the absolute limit
+        cpu_high = _share_above(series['cpu'], self.thresholds['cpu_high'])
+        if cpu_high >= SUSTAINED_SHARE:
+            patterns.append(PerformancePattern(
+                metric='cpu',
+                pattern_type='sustained',
+                severity=min(10, 5 + int(5 * cpu_high)),
+                description=f"CPU usage above {self.thresholds['cpu_high']:.0f}% for {cpu_high:.0%} of samples",
+                recommendation="Consider reducing scan thread count or adjusting scan frequency",
+                impact=0.3
+            ))
+            
+        return patterns
+        
+    def _memory_patterns(self, series: Dict[str, np.ndarray]) -> List[PerformancePattern]:
+        """Identify memory usage patterns"""
+        patterns = []
+        memory_usage = series['memory']
+        
+        memory_spikes = _find_spikes(memory_usage, self.thresholds['spike_gap'])
+        if memory_spikes:
+            patterns.append(PerformancePattern(
+                metric='memory',
+                pattern_type='spike',
+                severity=min(10, 1 + memory_spikes),
+                description=f"Memory usage spikes detected ({memory_spikes} samples)",
+                recommendation="Review cache settings and batch processing size",
+                impact=0.25
+            ))
+            
+        memory_high = _share_above(memory_usage, self.thresholds['memory_high'])
+        if memory_high >= SUSTAINED_SHARE:
+            patterns.append(PerformancePattern(
+                metric='memory',
+                pattern_type='sustained',
+                severity=min(10, 5 + int(5 * memory_high)),
+                description=f"Memory usage above {self.thresholds['memory_high']} MB for {memory_high:.0%} of samples",
+                recommendation="Review cache settings and batch processing size",
+                impact=0.25
+            ))
+            
+        # Check for memory trends; the slope of block means is per block, so
+        # scale it back to per sample
+        downsampled = _downsample(memory_usage, DOWNSAMPLE_FACTOR)
+        memory_trend = self._calculate_trend(downsampled) * downsampled.size / max(memory_usage.size, 1)
         if memory_trend > 0.1:  # 10% increase trend
             patterns.append(PerformancePattern(
                 metric='memory',
@@ -103,9 +322,26 @@ class PerformanceAnalyzer:
                 impact=0.25
             ))
             
-        # Check for scan speed consistency
-        speed_variance = np.var(scan_speed) if scan_speed else 0
-        if speed_variance > 10000:  # High variance in scan speed
+        return patterns
+        
+    def _scan_speed_patterns(self, series: Dict[str, np.ndarray]) -> List[PerformancePattern]:
+        """Identify scan speed patterns"""
+        patterns = []
+        scan_speed = series['scan_speed']
+        
+        # Check for scan speed consistency; when the series is the monitor's
+        # whole buffer its running variance is already known. Otherwise use
+        # block means, whose variance shrinks with the block size for
+        # independent noise, so the limit shrinks with it
+        variance_limit = self.thresholds['scan_speed_variance']
+        running = self.performance_monitor.get_running_stats()['scan_speed']
+        if scan_speed.size and running['count'] == scan_speed.size:
+            speed_variance = running['variance']
+        else:
+            downsampled = _downsample(scan_speed, DOWNSAMPLE_FACTOR)
+            speed_variance = _variance(downsampled)
+            variance_limit *= downsampled.size / max(scan_speed.size, 1)
+        if speed_variance > variance_limit:  # High variance in scan speed
             patterns.append(PerformancePattern(
                 metric='scan_speed',
                 pattern_type='periodic',
@@ -121,18 +357,17 @@ class PerformanceAnalyzer:
         """Generate optimization recommendations based on patterns"""
         recommendations = []
         
-        # Group patterns by metric
-        metric_patterns = {}
+        # Highest pattern severity per metric
+        max_severity: Dict[str, int] = {}
         for pattern in patterns:
-            if pattern.metric not in metric_patterns:
-                metric_patterns[pattern.metric] = []
-            metric_patterns[pattern.metric].append(pattern)
+            if pattern.severity > max_severity.get(pattern.metric, 0):
+                max_severity[pattern.metric] = pattern.severity
             
         # Generate recommendations for each metric
-        if 'cpu' in metric_patterns:
+        if 'cpu' in max_severity:
             recommendations.append({
                 'category': 'CPU Optimization',
-                'priority': self._calculate_priority(metric_patterns['cpu']),
+                'priority': self._calculate_priority(max_severity['cpu']),
                 'suggestions': [
                     "Reduce maximum thread count",
                     "Implement smarter process prioritization",
@@ -141,10 +376,10 @@ class PerformanceAnalyzer:
                 'estimated_impact': 'High'
             })
             
-        if 'memory' in metric_patterns:
+        if 'memory' in max_severity:
             recommendations.append({
                 'category': 'Memory Management',
-                'priority': self._calculate_priority(metric_patterns['memory']),
+                'priority': self._calculate_priority(max_severity['memory']),
                 'suggestions': [
                     "Adjust cache size limits",
                     "Implement memory-efficient data structures",
@@ -153,10 +388,10 @@ class PerformanceAnalyzer:
                 'estimated_impact': 'Medium'
             })
             
-        if 'scan_speed' in metric_patterns:
+        if 'scan_speed' in max_severity:
             recommendations.append({
                 'category': 'Scan Performance',
-                'priority': self._calculate_priority(metric_patterns['scan_speed']),
+                'priority': self._calculate_priority(max_severity['scan_speed']),
                 'suggestions': [
                     "Optimize file filtering rules",
                     "Implement predictive file loading",
@@ -180,69 +415,68 @@ class PerformanceAnalyzer:
         score = 100 * (1 - total_impact / max_possible_impact)
         return max(0.0, min(100.0, score))
         
-    def _calculate_trend(self, values: List[float]) -> float:
+    def _calculate_trend(self, values: np.ndarray) -> float:
         """Calculate trend coefficient for a series of values"""
-        if not values:
+        if not values.size:
             return 0.0
             
-        x = np.arange(len(values))
-        y = np.array(values)
-        
-        # Calculate linear regression
+        # Slope of the linear regression, normalized by the mean
         try:
-            slope = np.polyfit(x, y, 1)[0]
-            return slope / np.mean(values)  # Normalize by mean
-        except:
+            return float(_slope_over_mean(values))
+        except Exception:
             return 0.0
             
-    def _calculate_priority(self, patterns: List[PerformancePattern]) -> str:
-        """Calculate priority based on pattern severity"""
-        max_severity = max(p.severity for p in patterns)
+    def _calculate_priority(self, max_severity: int) -> str:
+        """Calculate priority from the highest pattern severity"""
         if max_severity >= 8:
             return 'High'
         elif max_severity >= 5:
             return 'Medium'
         return 'Low'
         
-    def _generate_metrics_summary(self, metrics: List[Dict]) -> Dict:
-        """Generate summary statistics for metrics"""
-        if not metrics:
+    def _generate_metrics_summary(self, series: Dict[str, np.ndarray]) -> Dict:
+        """Generate summary statistics for metric series"""
+        if not series['cpu'].size:
             return {}
             
         return {
-            'cpu': {
-                'average': np.mean([m['cpu_usage'] for m in metrics]),
-                'max': max(m['cpu_usage'] for m in metrics),
-                'min': min(m['cpu_usage'] for m in metrics)
-            },
-            'memory': {
-                'average': np.mean([m['memory_usage'] for m in metrics]),
-                'max': max(m['memory_usage'] for m in metrics),
-                'min': min(m['memory_usage'] for m in metrics)
-            },
-            'scan_speed': {
-                'average': np.mean([m.get('scan_speed', 0) for m in metrics]),
-                'max': max(m.get('scan_speed', 0) for m in metrics),
-                'min': min(m.get('scan_speed', 0) for m in metrics)
+            name: {
+                'average': float(_nanmean(values)),
+                'max': float(_nanmax(values)),
+                'min': float(_nanmin(values))
             }
+            for name, values in series.items()
         }
         
     def _pattern_to_dict(self, pattern: PerformancePattern) -> Dict:
         """Convert pattern to dictionary for serialization"""
-        return {
-            'metric': pattern.metric,
-            'pattern_type': pattern.pattern_type,
-            'severity': pattern.severity,
-            'description': pattern.description,
-            'recommendation': pattern.recommendation,
-            'impact': pattern.impact
-        }
+        return asdict(pattern)
         
     def _save_analysis(self, analysis: Dict):
-        """Save analysis results to disk"""
+        """Append analysis results to today's analysis log"""
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            file_path = self.analysis_dir / f"analysis_{timestamp}.json"
-            file_path.write_text(json.dumps(analysis, indent=2))
+            today = date.today()
+            if self._analysis_log_date != today:
+                if self._analysis_log is not None:
+                    self._analysis_log.close()
+                self._analysis_log = self._analysis_log_file(today).open('ab', buffering=0)
+                self._analysis_log_date = today
+            self._analysis_log.write(_dumps(analysis) + b"\n")
         except Exception as e:
-            self.logger.error(f"Failed to save analysis: {e}") 
\ No newline at end of file
+            self.logger.error(f"Failed to save analysis: {e}")
+            
+    def _analysis_log_file(self, day: date) -> Path:
+        """Path of the analysis log for a day"""
+        return self.analysis_dir / f"analysis_{day.strftime('%Y%m%d')}.jsonl"
+        
+    def export_json(self, day: Optional[date] = None) -> Optional[Path]:
+        """Write a day's analyses as one indented JSON file, for debugging"""
+        day = day or date.today()
+        log_file = self._analysis_log_file(day)
+        if not log_file.exists():
+            return None
+        with log_file.open('rb') as f:
+            analyses = [_loads(line) for line in f if line.strip()]
+        export_file = log_file.with_suffix('.json')
+        export_file.write_text(json.dumps(analyses, indent=2))
+        return export_file 
\ No newline at end of file
@@ -1,18 +1,26 @@
 import time
-import psutil
 import logging
-from typing import Dict, List, Optional, Deque
-from collections import deque
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import threading
 import json
+import os
+import sys
 from pathlib import Path
+import numpy as np
+
+# Seconds between samples while scanning; when no files are being processed
+# the interval doubles up to IDLE_SAMPLE_INTERVAL_MAX
+SAMPLE_INTERVAL = 1.0
+IDLE_SAMPLE_INTERVAL_MAX = 8.0
+
+SECTOR_SIZE = 512  # /proc/diskstats counts 512-byte sectors
 
 @dataclass
 class PerformanceMetric:
     """Container for performance measurements"""
-    timestamp: datetime
+    timestamp_ns: int  # wall-clock time from time.time_ns()
     scan_speed: float  # files/second
     memory_usage: float  # MB
     cpu_usage: float  # percentage
@@ -21,175 +29,463 @@ class PerformanceMetric:
     files_processed: int
     threads_active: int
 
+def _welford_add(stats: List, x: float):
+    """Add a sample to [count, mean, M2] running statistics"""
+    stats[0] += 1
+    delta = x - stats[1]
+    stats[1] += delta / stats[0]
+    stats[2] += delta * (x - stats[1])
+
+def _welford_remove(stats: List, x: float):
+    """Remove a previously added sample from [count, mean, M2] running statistics"""
+    stats[0] -= 1
+    if stats[0] == 0:
+        stats[1] = stats[2] = 0.0
+        return
+    delta = x - stats[1]
+    stats[1] -= delta / stats[0]
+    stats[2] -= delta * (x - stats[1])
+
+class _ProcSampler:
+    """Reads CPU, memory and disk counters directly from /proc on Linux
+    
+    The /proc files are kept open and re-read from offset 0 each sample,
+    which avoids psutil's per-call open and line-by-line parsing.
+    """
+    
+    def __init__(self):
+        self._stat_fd = os.open('/proc/stat', os.O_RDONLY)
+        self._meminfo_fd = os.open('/proc/meminfo', os.O_RDONLY)
+        self._diskstats_fd = os.open('/proc/diskstats', os.O_RDONLY)
+        # Whole disks only, as partitions would double count their I/O
+        self._disks = {name.encode() for name in os.listdir('/sys/block')}
+        self._last_busy, self._last_total = self._cpu_times()
+        
+    @staticmethod
+    def _read(fd: int) -> bytes:
+        return os.pread(fd, 1 << 16, 0)
+        
+    def _cpu_times(self) -> Tuple[int, int]:
+        """Busy and total jiffies from the aggregate cpu line"""
+        line = self._read(self._stat_fd).split(b"\n", 1)[0]
+        # user nice system idle iowait irq softirq steal
+        times = [int(v) for v in line.split()[1:9]]
+        total = sum(times)
+        return total - times[3] - times[4], total
+        
+    def cpu_percent(self) -> float:
+        """System-wide CPU utilization since the previous call"""
+        busy, total = self._cpu_times()
+        busy_delta = busy - self._last_busy
+        total_delta = total - self._last_total
+        self._last_busy, self._last_total = busy, total
+        return 100.0 * busy_delta / total_delta if total_delta > 0 else 0.0
+        
+    def memory_used(self) -> int:
+        """Used memory in bytes, computed as total minus available"""
+        fields = {}
+        for line in self._read(self._meminfo_fd).splitlines():
+            key, _, rest = line.partition(b":")
+            if key in (b"MemTotal", b"MemAvailable", b"MemFree"):
+                fields[key] = int(rest.split()[0]) * 1024
+        return fields[b"MemTotal"] - fields.get(b"MemAvailable", fields[b"MemFree"])
+        
+    def disk_bytes(self) -> Tuple[int, int]:
+        """Total bytes read and written by all disks"""
+        read_bytes: int = 0
+        write_bytes: int = 0
+        for line in self._read(self._diskstats_fd).splitlines():
+            fields = line.split()
+            if len(fields) >= 14 and fields[2] in self._disks:
+                read_bytes += int(fields[5])
+                write_bytes += int(fields[9])
+        return read_bytes * SECTOR_SIZE, write_bytes * SECTOR_SIZE
+        
 class PerformanceMonitor:
     """Monitors and tracks system performance metrics"""
     
     def __init__(self, history_size: int = 3600):  # 1 hour of history at 1 sample/second
         self.logger = logging.getLogger(__name__)
-        self.history: Deque[PerformanceMetric] = deque(maxlen=history_size)
-        self.is_monitoring = False
+        
+        # Metric history as a ring buffer with one array per field; _head is
+        # the next slot to write and _count the number of valid samples
+        self.history_size = history_size
+        self._ts_ns = np.zeros(history_size, np.int64)
+        self._scan = np.zeros(history_size, np.float32)
+        self._mem = np.zeros(history_size, np.float32)
+        self._cpu = np.zeros(history_size, np.float32)
+        self._io_read = np.zeros(history_size, np.float32)
+        self._io_write = np.zeros(history_size, np.float32)
+        self._files = np.zeros(history_size, np.int64)
+        self._threads = np.zeros(history_size, np.int32)
+        self._head = 0
+        self._count = 0
+        
+        # Running count, mean and sum of squared deviations (Welford) of the
+        # samples in the ring buffer, updated as samples are added and evicted
+        self._running = {
+            'cpu_usage': [0, 0.0, 0.0],
+            'memory_usage': [0, 0.0, 0.0],
+            'scan_speed': [0, 0.0, 0.0]
+        }
+        self._running_fields = (
+            (self._running['cpu_usage'], self._cpu),
+            (self._running['memory_usage'], self._mem),
+            (self._running['scan_speed'], self._scan)
+        )
+        
+        # Files processed since startup, reported by the scanner, and the
+        # count and time at the previous scan speed calculation
+        self._files_processed = 0
+        self._files_lock = threading.Lock()
+        self._last_files_snapshot = 0
+        self._last_files_time = time.monotonic()
+        
+        # Set while monitoring is stopped; the loop waits on it between samples
+        # so stop_monitoring takes effect immediately
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.monitor_thread: Optional[threading.Thread] = None
-        self.last_io_counters = psutil.disk_io_counters()
-        self.last_io_time = time.time()
-        self.metrics_file = Path("data/performance_metrics.json")
+        
+        # Read /proc directly on Linux and fall back to psutil elsewhere
+        self._proc_sampler: Optional[_ProcSampler] = None
+        if sys.platform.startswith('linux'):
+            try:
+                self._proc_sampler = _ProcSampler()
+            except (OSError, ValueError, IndexError, KeyError) as e:
+                self.logger.debug(f"Falling back to psutil sampling: {e}")
+        # psutil is only imported when it's needed for sampling
+        if self._proc_sampler is None:
+            import psutil
+            self._psutil = psutil
+        self.last_io_counters: Tuple[int, int] = self._disk_bytes()
+        self.last_io_time: float = time.time()
+        self.sample_interval: float = SAMPLE_INTERVAL
+        self.metrics_file = Path("data/performance_metrics.npz")
+        self.legacy_metrics_file = Path("data/performance_metrics.json")
         
         # Performance thresholds
-        self.thresholds = {
+        self.thresholds: Dict[str, float] = {
             'scan_speed_min': 1000,  # files/second
             'memory_max': 512,  # MB
             'cpu_max': 30,  # percentage
             'io_max': 50  # MB/s
         }
+        self._scan_min: float
+        self._mem_max: float
+        self._cpu_max: float
+        self._io_max: float
+        self._apply_thresholds()
         
         # Load historical metrics
         self._load_metrics()
         
+    @property
+    def is_monitoring(self) -> bool:
+        """Whether the monitoring thread is running"""
+        return not self._stop_event.is_set()
+        
     def start_monitoring(self):
         """Start performance monitoring"""
-        if not self.is_monitoring:
-            self.is_monitoring = True
+        if self._stop_event.is_set():
+            self._stop_event.clear()
             self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self.monitor_thread.start()
             self.logger.info("Performance monitoring started")
             
     def stop_monitoring(self):
         """Stop performance monitoring"""
-        self.is_monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join()
             self._save_metrics()
             self.logger.info("Performance monitoring stopped")
             
+    def record_files(self, count: int):
+        """Record that the scanner processed count more files"""
+        with self._files_lock:
+            self._files_processed += count
+            
     def _monitor_loop(self):
         """Main monitoring loop"""
-        while self.is_monitoring:
+        stop_event = self._stop_event
+        while not stop_event.is_set():
             try:
                 metric = self._collect_metrics()
-                self.history.append(metric)
+                self._append(metric)
                 self._check_thresholds(metric)
-                time.sleep(1)  # Collect metrics every second
+                
+                # Sample every second while scanning and back off when idle
+                if metric.scan_speed > 0:
+                    self.sample_interval = SAMPLE_INTERVAL
+                else:
+                    self.sample_interval = min(self.sample_interval * 2, IDLE_SAMPLE_INTERVAL_MAX)
+                stop_event.wait(self.sample_interval)
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
                 
     def _collect_metrics(self) -> PerformanceMetric:
         """Collect current performance metrics"""
+        # Locals are annotated so a mypyc build compiles them to C values
+        cpu_percent: float
+        memory_used: int
+        
         # Get CPU and memory usage
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
+        if self._proc_sampler is not None:
+            cpu_percent = self._proc_sampler.cpu_percent()
+            memory_used = self._proc_sampler.memory_used()
+        else:
+            cpu_percent = self._psutil.cpu_percent()
+            memory_used = self._psutil.virtual_memory().used
         
         # Calculate disk I/O rates
-        current_io = psutil.disk_io_counters()
-        current_time = time.time()
-        time_delta = current_time - self.last_io_time
+        current_io: Tuple[int, int] = self._disk_bytes()
+        current_time: float = time.time()
+        time_delta: float = current_time - self.last_io_time
         
-        read_speed = (current_io.read_bytes - self.last_io_counters.read_bytes) / time_delta / 1024 / 1024
-        write_speed = (current_io.write_bytes - self.last_io_counters.write_bytes) / time_delta / 1024 / 1024
+        read_speed: float = (current_io[0] - self.last_io_counters[0]) / time_delta / 1024 / 1024
+        write_speed: float = (current_io[1] - self.last_io_counters[1]) / time_delta / 1024 / 1024
         
         self.last_io_counters = current_io
         self.last_io_time = current_time
         
         # Get thread count
-        threads_active = threading.active_count()
+        threads_active: int = threading.active_count()
+        
+        # Scan speed is derived from the counter snapshot it takes, which is
+        # also stored as files_processed so the two fields always agree
+        scan_speed: float = self._calculate_scan_speed()
         
         return PerformanceMetric(
-            timestamp=datetime.now(),
-            scan_speed=self._calculate_scan_speed(),
-            memory_usage=memory.used / 1024 / 1024,  # Convert to MB
+            timestamp_ns=time.time_ns(),
+            scan_speed=scan_speed,
+            memory_usage=memory_used / 1024 / 1024,  # Convert to MB
             cpu_usage=cpu_percent,
             disk_io_read=read_speed,
             disk_io_write=write_speed,
-            files_processed=self._get_files_processed(),
+            files_processed=self._last_files_snapshot,
             threads_active=threads_active
         )
         
+    def _disk_bytes(self) -> Tuple[int, int]:
+        """Total (read, written) disk bytes"""
+        if self._proc_sampler is not None:
+            return self._proc_sampler.disk_bytes()
+        counters = self._psutil.disk_io_counters()
+        return counters.read_bytes, counters.write_bytes
+        
+    def _append(self, metric: PerformanceMetric):
+        """Store a metric sample in the ring buffer, overwriting the oldest"""
+        i = self._head
+        if self._count == self.history_size:
+            for stats, values in self._running_fields:
+                _welford_remove(stats, float(values[i]))
+        self._ts_ns[i] = metric.timestamp_ns
+        self._scan[i] = metric.scan_speed
+        self._mem[i] = metric.memory_usage
+        self._cpu[i] = metric.cpu_usage
+        self._io_read[i] = metric.disk_io_read
+        self._io_write[i] = metric.disk_io_write
+        self._files[i] = metric.files_processed
+        self._threads[i] = metric.threads_active
+        for stats, values in self._running_fields:
+            _welford_add(stats, float(values[i]))
+        self._head = (i + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+        
+    def _rebuild_running_stats(self):
+        """Recompute the running statistics from the ring buffer contents"""
+        for stats, values in self._running_fields:
+            samples = self._ordered(values).astype(np.float64)
+            if samples.size:
+                mean = samples.mean()
+                stats[:] = [samples.size, float(mean), float(((samples - mean) ** 2).sum())]
+            else:
+                stats[:] = [0, 0.0, 0.0]
+                
+    def get_running_stats(self) -> Dict[str, Dict]:
+        """Get mean and variance of the buffered cpu, memory and scan speed samples
+        
+        Variance is the population variance, as computed by np.var.
+        """
+        return {
+            name: {
+                'count': count,
+                'mean': mean,
+                'variance': max(m2 / count, 0.0) if count else 0.0
+            }
+            for name, (count, mean, m2) in self._running.items()
+        }
+        
+    def _fields(self) -> Dict[str, np.ndarray]:
+        """Ring buffer arrays by their persisted field name"""
+        return {
+            'ts_ns': self._ts_ns,
+            'scan_speed': self._scan,
+            'memory_usage': self._mem,
+            'cpu_usage': self._cpu,
+            'disk_io_read': self._io_read,
+            'disk_io_write': self._io_write,
+            'files_processed': self._files,
+            'threads_active': self._threads
+        }
+        
+    def _ordered(self, values: np.ndarray) -> np.ndarray:
+        """Valid samples of a field, oldest first"""
+        if self._count < self.history_size:
+            return values[:self._count]
+        return np.concatenate((values[self._head:], values[:self._head]))
+        
+    def _segments(self, values: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """Valid samples of a field as oldest-first views, without copying"""
+        if self._count < self.history_size:
+            return (values[:self._count],)
+        return (values[self._head:], values[:self._head])
+        
+    def _range_segments(self, values: np.ndarray, start: int, stop: int) -> List[np.ndarray]:
+        """Views of a field's samples at chronological indexes start to stop"""
+        views = []
+        for segment in self._segments(values):
+            n = len(segment)
+            if start < n and stop > 0:
+                views.append(segment[max(start, 0):min(stop, n)])
+            start -= n
+            stop -= n
+        return views
+        
+    def _find_after(self, cutoff_ns: int) -> int:
+        """Chronological index of the first sample newer than cutoff_ns"""
+        offset = 0
+        for segment in self._segments(self._ts_ns):
+            i = int(np.searchsorted(segment, cutoff_ns, side='right'))
+            if i < len(segment):
+                return offset + i
+            offset += len(segment)
+        return offset
+        
+    def _slot(self, k: int) -> int:
+        """Ring slot of the sample at chronological index k"""
+        return (self._head - self._count + k) % self.history_size
+        
+    def _sample_dict(self, i: int) -> Dict:
+        """Convert the sample in ring slot i to its dictionary form"""
+        return {
+            'timestamp': datetime.fromtimestamp(self._ts_ns[i] / 1e9).isoformat(),
+            'scan_speed': float(self._scan[i]),
+            'memory_usage': float(self._mem[i]),
+            'cpu_usage': float(self._cpu[i]),
+            'disk_io_read': float(self._io_read[i]),
+            'disk_io_write': float(self._io_write[i]),
+            'files_processed': int(self._files[i]),
+            'threads_active': int(self._threads[i])
+        }
+        
     def _calculate_scan_speed(self) -> float:
-        """Calculate current scan speed (files/second)"""
-        if len(self.history) < 2:
-            return 0.0
-            
-        recent_metrics = list(self.history)[-2:]
-        files_delta = recent_metrics[1].files_processed - recent_metrics[0].files_processed
-        time_delta = (recent_metrics[1].timestamp - recent_metrics[0].timestamp).total_seconds()
+        """Calculate scan speed (files/second) since the previous call"""
+        files = self._files_processed
+        now = time.monotonic()
+        time_delta = now - self._last_files_time
+        files_delta = files - self._last_files_snapshot
+        self._last_files_snapshot = files
+        self._last_files_time = now
         
         return files_delta / time_delta if time_delta > 0 else 0.0
         
-    def _get_files_processed(self) -> int:
-        """Get total files processed"""
-        return sum(1 for metric in self.history if metric.scan_speed > 0)
+    def _apply_thresholds(self):
+        """Copy the thresholds into attributes read by the per-tick check
+        
+        Call again after changing self.thresholds.
+        """
+        self._scan_min = self.thresholds['scan_speed_min']
+        self._mem_max = self.thresholds['memory_max']
+        self._cpu_max = self.thresholds['cpu_max']
+        self._io_max = self.thresholds['io_max']
         
     def _check_thresholds(self, metric: PerformanceMetric):
         """Check if metrics exceed thresholds"""
+        io_rate: float = max(metric.disk_io_read, metric.disk_io_write)
+        scan_low: bool = metric.scan_speed < self._scan_min
+        mem_high: bool = metric.memory_usage > self._mem_max
+        cpu_high: bool = metric.cpu_usage > self._cpu_max
+        io_high: bool = io_rate > self._io_max
+        if not (scan_low or mem_high or cpu_high or io_high):
+            return
+            
         violations = []
         
-        if metric.scan_speed < self.thresholds['scan_speed_min']:
+        if scan_low:
             violations.append(f"Scan speed below minimum: {metric.scan_speed:.1f} files/sec")
             
-        if metric.memory_usage > self.thresholds['memory_max']:
+        if mem_high:
             violations.append(f"Memory usage exceeds maximum: {metric.memory_usage:.1f} MB")
             
-        if metric.cpu_usage > self.thresholds['cpu_max']:
+        if cpu_high:
             violations.append(f"CPU usage exceeds maximum: {metric.cpu_usage:.1f}%")
             
-        if max(metric.disk_io_read, metric.disk_io_write) > self.thresholds['io_max']:
-            violations.append(f"Disk I/O exceeds maximum: {max(metric.disk_io_read, metric.disk_io_write):.1f} MB/s")
-            
-        if violations:
-            self.logger.warning("Performance thresholds exceeded:\n" + "\n".join(violations))
+        if io_high:
+            violations.append(f"Disk I/O exceeds maximum: {io_rate:.1f} MB/s")
             
+        self.logger.warning("Performance thresholds exceeded:\n" + "\n".join(violations))
+        
     def get_current_metrics(self) -> Dict:
         """Get current performance metrics"""
-        if not self.history:
+        if not self._count:
             return {}
             
-        latest = self.history[-1]
-        return {
-            'timestamp': latest.timestamp.isoformat(),
-            'scan_speed': latest.scan_speed,
-            'memory_usage': latest.memory_usage,
-            'cpu_usage': latest.cpu_usage,
-            'disk_io_read': latest.disk_io_read,
-            'disk_io_write': latest.disk_io_write,
-            'files_processed': latest.files_processed,
-            'threads_active': latest.threads_active
-        }
+        return self._sample_dict((self._head - 1) % self.history_size)
+        
+    def get_metrics_history(self, duration: timedelta = timedelta(days=7)) -> List[Dict]:
+        """Get metrics recorded within the specified duration"""
+        cutoff_ns = time.time_ns() - round(duration.total_seconds() * 1e9)
+        start = self._find_after(cutoff_ns)
+        return [self._sample_dict(self._slot(k)) for k in range(start, self._count)]
+        
+    def get_average_metrics(self, duration: timedelta = timedelta(minutes=5),
+                            start_time: Optional[datetime] = None) -> Dict:
+        """Get average metrics over specified duration
         
-    def get_average_metrics(self, duration: timedelta = timedelta(minutes=5)) -> Dict:
-        """Get average metrics over specified duration"""
-        cutoff_time = datetime.now() - duration
-        recent_metrics = [m for m in self.history if m.timestamp > cutoff_time]
+        The window ends now, or covers duration from start_time if given.
+        """
+        duration_ns = round(duration.total_seconds() * 1e9)
+        if start_time is None:
+            start = self._find_after(time.time_ns() - duration_ns)
+            stop = self._count
+        else:
+            start_ns = round(start_time.timestamp() * 1e9)
+            start = self._find_after(start_ns)
+            stop = self._find_after(start_ns + duration_ns)
+        count = stop - start
         
-        if not recent_metrics:
+        if count <= 0:
             return {}
             
+        def mean(values: np.ndarray) -> float:
+            total = sum(float(segment.sum(dtype=np.float64))
+                        for segment in self._range_segments(values, start, stop))
+            return total / count
+            
+        first = self._slot(start)
+        last = self._slot(stop - 1)
         return {
-            'scan_speed': sum(m.scan_speed for m in recent_metrics) / len(recent_metrics),
-            'memory_usage': sum(m.memory_usage for m in recent_metrics) / len(recent_metrics),
-            'cpu_usage': sum(m.cpu_usage for m in recent_metrics) / len(recent_metrics),
-            'disk_io_read': sum(m.disk_io_read for m in recent_metrics) / len(recent_metrics),
-            'disk_io_write': sum(m.disk_io_write for m in recent_metrics) / len(recent_metrics),
-            'files_processed': recent_metrics[-1].files_processed - recent_metrics[0].files_processed,
-            'duration_seconds': (recent_metrics[-1].timestamp - recent_metrics[0].timestamp).total_seconds()
+            'scan_speed': mean(self._scan),
+            'memory_usage': mean(self._mem),
+            'cpu_usage': mean(self._cpu),
+            'disk_io_read': mean(self._io_read),
+            'disk_io_write': mean(self._io_write),
+            'files_processed': int(self._files[last] - self._files[first]),
+            'duration_seconds': float(self._ts_ns[last] - self._ts_ns[first]) / 1e9
         }
         
     def _save_metrics(self):
-        """Save metrics history to disk"""
+        """Save metrics history to disk as compressed arrays"""
         try:
-            metrics_data = [
-                {
-                    'timestamp': m.timestamp.isoformat(),
-                    'scan_speed': m.scan_speed,
-                    'memory_usage': m.memory_usage,
-                    'cpu_usage': m.cpu_usage,
-                    'disk_io_read': m.disk_io_read,
-                    'disk_io_write': m.disk_io_write,
-                    'files_processed': m.files_processed,
-                    'threads_active': m.threads_active
-                }
-                for m in self.history
-            ]
-            
             self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
-            self.metrics_file.write_text(json.dumps(metrics_data, indent=2))
+            tmp_file = self.metrics_file.with_suffix('.npz.tmp')
+            with tmp_file.open('wb') as f:
+                np.savez_compressed(f, **{
+                    name: self._ordered(values) for name, values in self._fields().items()
+                })
+            os.replace(tmp_file, self.metrics_file)
             
         except Exception as e:
             self.logger.error(f"Failed to save performance metrics: {e}")
@@ -198,10 +494,22 @@ class PerformanceMonitor:
         """Load metrics history from disk"""
         try:
             if self.metrics_file.exists():
-                metrics_data = json.loads(self.metrics_file.read_text())
-                self.history.extend(
+                with np.load(self.metrics_file) as data:
+                    count = 0
+                    for name, values in self._fields().items():
+                        saved = data[name][-self.history_size:]
+                        count = len(saved)
+                        values[:count] = saved
+                self._count = count
+                self._head = count % self.history_size
+                self._rebuild_running_stats()
+                
+            elif self.legacy_metrics_file.exists():
+                # Metrics saved as JSON by older versions
+                metrics_data = json.loads(self.legacy_metrics_file.read_text())
+                for metric in (
                     PerformanceMetric(
-                        timestamp=datetime.fromisoformat(m['timestamp']),
+                        timestamp_ns=round(datetime.fromisoformat(m['timestamp']).timestamp() * 1e9),
                         scan_speed=m['scan_speed'],
                         memory_usage=m['memory_usage'],
                         cpu_usage=m['cpu_usage'],
@@ -210,8 +518,9 @@ class PerformanceMonitor:
                         files_processed=m['files_processed'],
                         threads_active=m['threads_active']
                     )
-                    for m in metrics_data
-                )
+                    for m in metrics_data[-self.history_size:]
+                ):
+                    self._append(metric)
                 
         except Exception as e:
-            self.logger.error(f"Failed to load performance metrics: {e}") 
\ No newline at end of file
+            self.logger.error(f"Failed to load performance metrics: {e}")
@@ -1,11 +1,60 @@
 import json
 import logging
+import os
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.figure import Figure
 from .performance_monitor import PerformanceMonitor
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+def _dumps_indented(obj) -> bytes:
+    """Serialize to JSON bytes indented by two spaces"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, default=float).encode()
+
+def _write_indented(f, obj: Dict):
+    """Write a dict as the same JSON as _dumps_indented, one piece at a time
+    
+    Each top-level value, and each element of a top-level list, is encoded
+    separately and re-indented to its depth, so the whole document is never
+    held in memory as one buffer.
+    """
+    if not obj:
+        f.write(b"{}")
+        return
+    f.write(b"{")
+    for i, (key, value) in enumerate(obj.items()):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(_dumps_indented(key) + b": ")
+        if isinstance(value, list) and value:
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b",\n    " if j else b"\n    ")
+                f.write(_dumps_indented(item).replace(b"\n", b"\n    "))
+            f.write(b"\n  ]")
+        else:
+            f.write(_dumps_indented(value).replace(b"\n", b"\n  "))
+    f.write(b"\n}")
+
+# Target maximums the efficiency scores are measured against
+CPU_TARGET = 30  # percentage
+MEMORY_TARGET = 512  # MB
+IO_TARGET = 50  # MB/s, read plus write
+
+def _efficiency_score(usage: float, target: float) -> float:
+    """Score usage against a target maximum (0-100)"""
+    if usage <= target:
+        return 100 * (1 - usage / target)
+    return max(0, 100 * (1 - (usage - target) / target))
+
 class PerformanceReporter:
     """Generates and manages performance reports"""
     
@@ -20,23 +69,28 @@ class PerformanceReporter:
         try:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=7)
+            metrics = self.performance_monitor.get_average_metrics(end_date - start_date)
+            daily_metrics = self._collect_daily_metrics(start_date, end_date)
             
             report = {
                 'period': {
                     'start': start_date.isoformat(),
                     'end': end_date.isoformat()
                 },
-                'summary': self._generate_summary(start_date, end_date),
-                'daily_metrics': self._collect_daily_metrics(start_date, end_date),
-                'resource_usage': self._analyze_resource_usage(start_date, end_date),
-                'performance_issues': self._identify_issues(start_date, end_date),
+                'summary': self._generate_summary(metrics),
+                'daily_metrics': daily_metrics,
+                'resource_usage': self._analyze_resource_usage(metrics, daily_metrics),
+                'performance_issues': self._identify_issues(metrics),
                 'recommendations': self._generate_recommendations(),
                 'generated_at': datetime.now().isoformat()
             }
             
             # Save report
             report_file = self.reports_dir / f"weekly_report_{end_date.strftime('%Y%m%d')}.json"
-            report_file.write_text(json.dumps(report, indent=2))
+            tmp_file = report_file.with_suffix('.tmp')
+            with tmp_file.open('wb') as f:
+                _write_indented(f, report)
+            os.replace(tmp_file, report_file)
             
             # Generate visualizations
             self._generate_visualizations(report, report_file.stem)
@@ -47,10 +101,8 @@ class PerformanceReporter:
             self.logger.error(f"Failed to generate weekly report: {e}")
             return {}
             
-    def _generate_summary(self, start_date: datetime, end_date: datetime) -> Dict:
-        """Generate performance summary statistics"""
-        metrics = self.performance_monitor.get_average_metrics(end_date - start_date)
-        
+    def _generate_summary(self, metrics: Dict) -> Dict:
+        """Generate performance summary statistics from the period's average metrics"""
         return {
             'average_cpu_usage': metrics['cpu_usage'],
             'average_memory_usage': metrics['memory_usage'],
@@ -84,35 +136,40 @@ class PerformanceReporter:
             
         return daily_metrics
         
-    def _analyze_resource_usage(self, start_date: datetime, end_date: datetime) -> Dict:
-        """Analyze resource usage patterns"""
-        metrics = self.performance_monitor.get_average_metrics(end_date - start_date)
+    def _analyze_resource_usage(self, metrics: Dict, daily_metrics: List[Dict]) -> Dict:
+        """Analyze resource usage patterns from the period's average and daily metrics"""
+        
+        # Daily peaks in one pass; days without samples have empty metrics
+        cpu_peak = memory_peak = io_peak = 0.0
+        for day in daily_metrics:
+            day_metrics = day['metrics']
+            if not day_metrics:
+                continue
+            cpu_peak = max(cpu_peak, day_metrics['cpu_usage'])
+            memory_peak = max(memory_peak, day_metrics['memory_usage'])
+            io_peak = max(io_peak, day_metrics['disk_io_read'] + day_metrics['disk_io_write'])
         
         return {
             'cpu_analysis': {
                 'average_usage': metrics['cpu_usage'],
-                'peak_usage': max(m['metrics']['cpu_usage'] 
-                                for m in self._collect_daily_metrics(start_date, end_date)),
+                'peak_usage': cpu_peak,
                 'efficiency_score': self._calculate_cpu_efficiency(metrics)
             },
             'memory_analysis': {
                 'average_usage': metrics['memory_usage'],
-                'peak_usage': max(m['metrics']['memory_usage'] 
-                                for m in self._collect_daily_metrics(start_date, end_date)),
+                'peak_usage': memory_peak,
                 'efficiency_score': self._calculate_memory_efficiency(metrics)
             },
             'disk_analysis': {
                 'average_io': (metrics['disk_io_read'] + metrics['disk_io_write']) / 2,
-                'peak_io': max(m['metrics']['disk_io_read'] + m['metrics']['disk_io_write']
-                              for m in self._collect_daily_metrics(start_date, end_date)),
+                'peak_io': io_peak,
                 'efficiency_score': self._calculate_disk_efficiency(metrics)
             }
         }
         
-    def _identify_issues(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Identify performance issues and bottlenecks"""
+    def _identify_issues(self, metrics: Dict) -> List[Dict]:
+        """Identify performance issues and bottlenecks from the period's average metrics"""
         issues = []
-        metrics = self.performance_monitor.get_average_metrics(end_date - start_date)
         
         # Check CPU usage
         if metrics['cpu_usage'] > 30:
@@ -192,79 +249,77 @@ class PerformanceReporter:
     def _generate_visualizations(self, report: Dict, report_name: str):
         """Generate performance visualization charts"""
         try:
+            # Extract every series in one pass into arrays, skipping days
+            # without samples
+            daily_metrics = report['daily_metrics']
+            n = len(daily_metrics)
+            dates = [None] * n
+            cpu_usage = np.empty(n)
+            memory_usage = np.empty(n)
+            scan_speed = np.empty(n)
+            k = 0
+            for day in daily_metrics:
+                metrics = day['metrics']
+                if not metrics:
+                    continue
+                dates[k] = day['date']
+                cpu_usage[k] = metrics['cpu_usage']
+                memory_usage[k] = metrics['memory_usage']
+                scan_speed[k] = metrics.get('scan_speed', 0)
+                k += 1
+            dates = dates[:k]
+            cpu_usage = cpu_usage[:k]
+            memory_usage = memory_usage[:k]
+            scan_speed = scan_speed[:k]
+                
+            # One figure is drawn and saved for each chart in turn. It is
+            # created without pyplot, so no GUI backend or global figure
+            # state is involved
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
+            
+            def save_chart(suffix: str, title: str, ylabel: str):
+                ax.set_title(title)
+                ax.set_xlabel('Date')
+                ax.set_ylabel(ylabel)
+                ax.tick_params(axis='x', labelrotation=45)
+                fig.tight_layout()
+                fig.savefig(self.reports_dir / f"{report_name}_{suffix}.png")
+                ax.clear()
+                
             # CPU Usage Chart
-            plt.figure(figsize=(10, 6))
-            dates = [m['date'] for m in report['daily_metrics']]
-            cpu_usage = [m['metrics']['cpu_usage'] for m in report['daily_metrics']]
-            plt.plot(dates, cpu_usage, marker='o')
-            plt.title('CPU Usage Over Time')
-            plt.xlabel('Date')
-            plt.ylabel('CPU Usage (%)')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(self.reports_dir / f"{report_name}_cpu.png")
-            plt.close()
+            ax.plot(dates, cpu_usage, marker='o')
+            save_chart('cpu', 'CPU Usage Over Time', 'CPU Usage (%)')
             
             # Memory Usage Chart
-            plt.figure(figsize=(10, 6))
-            memory_usage = [m['metrics']['memory_usage'] for m in report['daily_metrics']]
-            plt.plot(dates, memory_usage, marker='o', color='green')
-            plt.title('Memory Usage Over Time')
-            plt.xlabel('Date')
-            plt.ylabel('Memory Usage (MB)')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(self.reports_dir / f"{report_name}_memory.png")
-            plt.close()
+            ax.plot(dates, memory_usage, marker='o', color='green')
+            save_chart('memory', 'Memory Usage Over Time', 'Memory Usage (MB)')
             
             # Scan Speed Chart
-            plt.figure(figsize=(10, 6))
-            scan_speed = [m['metrics'].get('scan_speed', 0) for m in report['daily_metrics']]
-            plt.plot(dates, scan_speed, marker='o', color='orange')
-            plt.axhline(y=1000, color='r', linestyle='--', label='Target Speed')
-            plt.title('Scan Speed Over Time')
-            plt.xlabel('Date')
-            plt.ylabel('Files per Second')
-            plt.legend()
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(self.reports_dir / f"{report_name}_speed.png")
-            plt.close()
+            ax.plot(dates, scan_speed, marker='o', color='orange')
+            ax.axhline(y=1000, color='r', linestyle='--', label='Target Speed')
+            ax.legend()
+            save_chart('speed', 'Scan Speed Over Time', 'Files per Second')
             
         except Exception as e:
             self.logger.error(f"Failed to generate visualizations: {e}")
             
     def _calculate_efficiency(self, metrics: Dict) -> float:
         """Calculate overall resource efficiency score"""
-        cpu_score = self._calculate_cpu_efficiency(metrics)
-        memory_score = self._calculate_memory_efficiency(metrics)
-        disk_score = self._calculate_disk_efficiency(metrics)
-        
-        return (cpu_score + memory_score + disk_score) / 3
+        return (
+            _efficiency_score(metrics['cpu_usage'], CPU_TARGET)
+            + _efficiency_score(metrics['memory_usage'], MEMORY_TARGET)
+            + _efficiency_score(metrics['disk_io_read'] + metrics['disk_io_write'], IO_TARGET)
+        ) / 3
         
     def _calculate_cpu_efficiency(self, metrics: Dict) -> float:
         """Calculate CPU efficiency score (0-100)"""
-        cpu_usage = metrics['cpu_usage']
-        target_usage = 30  # Target maximum CPU usage
-        
-        if cpu_usage <= target_usage:
-            return 100 * (1 - cpu_usage / target_usage)
-        return max(0, 100 * (1 - (cpu_usage - target_usage) / target_usage))
+        return _efficiency_score(metrics['cpu_usage'], CPU_TARGET)
         
     def _calculate_memory_efficiency(self, metrics: Dict) -> float:
         """Calculate memory efficiency score (0-100)"""
-        memory_usage = metrics['memory_usage']
-        target_usage = 512  # Target maximum memory usage (MB)
-        
-        if memory_usage <= target_usage:
-            return 100 * (1 - memory_usage / target_usage)
-        return max(0, 100 * (1 - (memory_usage - target_usage) / target_usage))
+        return _efficiency_score(metrics['memory_usage'], MEMORY_TARGET)
         
     def _calculate_disk_efficiency(self, metrics: Dict) -> float:
         """Calculate disk I/O efficiency score (0-100)"""
-        io_usage = metrics['disk_io_read'] + metrics['disk_io_write']
-        target_usage = 50  # Target maximum I/O (MB/s)
-        
-        if io_usage <= target_usage:
-            return 100 * (1 - io_usage / target_usage)
-        return max(0, 100 * (1 - (io_usage - target_usage) / target_usage)) 
\ No newline at end of file
+        return _efficiency_score(metrics['disk_io_read'] + metrics['disk_io_write'], IO_TARGET) 
\ No newline at end of file
@@ -4,42 +4,43 @@ import platform
 import logging
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Mapping, Optional, Tuple
 import subprocess
+from .platform_utils import (
+    _HOME, _STARTUP_LOCATIONS, _SYSTEM, _SYSTEM_PATHS, _stat_to_permissions
+)
 
 # Global flag for platform detection
-IS_WINDOWS = platform.system().lower() == 'windows'
-IS_MACOS = platform.system().lower() == 'darwin'
-IS_LINUX = platform.system().lower() == 'linux'
+IS_WINDOWS = _SYSTEM == 'windows'
+IS_MACOS = _SYSTEM == 'darwin'
+IS_LINUX = _SYSTEM == 'linux'
+
+# The path tables are shared with platform_utils; only the temp directory
+# is specific to the adapter
+if IS_MACOS:
+    _TEMP_DIR = '/private/tmp'
+elif IS_LINUX:
+    _TEMP_DIR = '/tmp'
+else:
+    _TEMP_DIR = str(_HOME / 'temp')
 
 class SecurityHandler:
     """Handle platform-specific security operations"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.platform = platform.system().lower()
+        self.platform = _SYSTEM
         
     def get_file_permissions(self, path: Path) -> Dict:
         """Get file permissions in a platform-agnostic way"""
+        stat_info = None
         try:
             stat_info = path.stat()
+            permissions = _stat_to_permissions(stat_info)
+            if IS_WINDOWS:
+                permissions['platform'] = self.platform
+            return permissions
             
-            if IS_MACOS or IS_LINUX:
-                import pwd
-                import grp
-                return {
-                    'owner': pwd.getpwuid(stat_info.st_uid).pw_name,
-                    'group': grp.getgrgid(stat_info.st_gid).gr_name,
-                    'mode': stat_info.st_mode,
-                    'permissions': oct(stat_info.st_mode)[-3:]
-                }
-            else:  # Windows or other platforms
-                return {
-                    'mode': stat_info.st_mode,
-                    'permissions': oct(stat_info.st_mode)[-3:],
-                    'platform': self.platform
-                }
-                
         except Exception as e:
             self.logger.error(f"Error getting file permissions for {path}: {e}")
             return {
@@ -58,8 +59,6 @@ class PlatformAdapter:
         
     def _detect_platform(self) -> Dict[str, str]:
         """Detect current platform and capabilities"""
-        system = platform.system().lower()
-        
         # Platform-specific root check
         has_root = None
         if not IS_WINDOWS:
@@ -69,7 +68,7 @@ class PlatformAdapter:
                 has_root = False
         
         return {
-            'system': system,
+            'system': _SYSTEM,
             'release': platform.release(),
             'version': platform.version(),
             'machine': platform.machine(),
@@ -77,77 +76,20 @@ class PlatformAdapter:
             'is_64bit': sys.maxsize > 2**32,
             'has_root': has_root,
             'temp_dir': self._get_temp_dir(),
-            'user_home': str(Path.home())
+            'user_home': str(_HOME)
         }
         
-    def _get_system_paths(self) -> Dict[str, Path]:
+    def _get_system_paths(self) -> Mapping[str, Path]:
         """Get platform-specific system paths"""
-        paths = {}
-        
-        if IS_MACOS:
-            # macOS paths
-            paths.update({
-                'system': Path('/System'),
-                'applications': Path('/Applications'),
-                'library': Path('/Library'),
-                'user_library': Path.home() / 'Library',
-                'temp': Path('/private/tmp')
-            })
-        elif IS_LINUX:
-            # Linux paths
-            paths.update({
-                'root': Path('/'),
-                'bin': Path('/bin'),
-                'usr': Path('/usr'),
-                'etc': Path('/etc'),
-                'var': Path('/var'),
-                'tmp': Path('/tmp'),
-                'opt': Path('/opt')
-            })
-            
-        # Common paths
-        paths.update({
-            'home': Path.home(),
-            'documents': Path.home() / 'Documents',
-            'downloads': Path.home() / 'Downloads'
-        })
-        
-        return paths
+        return _SYSTEM_PATHS
         
     def _get_temp_dir(self) -> str:
         """Get platform-specific temporary directory"""
-        if IS_MACOS:
-            return '/private/tmp'
-        elif IS_LINUX:
-            return '/tmp'
-        return str(Path.home() / 'temp')
+        return _TEMP_DIR
         
-    def get_startup_locations(self) -> List[Path]:
+    def get_startup_locations(self) -> Tuple[Path, ...]:
         """Get platform-specific startup locations"""
-        locations = []
-        
-        if IS_MACOS:
-            # macOS startup locations
-            startup_paths = [
-                Path.home() / 'Library' / 'LaunchAgents',
-                Path('/Library/LaunchAgents'),
-                Path('/Library/LaunchDaemons'),
-                Path('/System/Library/LaunchAgents'),
-                Path('/System/Library/LaunchDaemons')
-            ]
-            locations.extend(startup_paths)
-        elif IS_LINUX:
-            # Linux startup locations
-            startup_paths = [
-                Path.home() / '.config' / 'autostart',
-                Path('/etc/xdg/autostart'),
-                Path.home() / '.profile',
-                Path.home() / '.bashrc',
-                Path('/etc/profile')
-            ]
-            locations.extend(startup_paths)
-            
-        return locations
+        return _STARTUP_LOCATIONS
         
     def get_process_info(self, pid: int) -> Optional[Dict]:
         """Get platform-specific process information"""
@@ -2,15 +2,129 @@ import os
 import sys
 import platform
 import logging
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+# Lowercase platform name, fixed for the life of the process
+_SYSTEM = platform.system().lower()
+
+if _SYSTEM != 'windows':
+    import pwd
+    import grp
+
+# Owner and group names by id; scanned files mostly share a few owners, and
+# each uncached lookup goes through NSS (files, or a directory service)
+@functools.lru_cache(maxsize=4096)
+def _uid_name(uid: int) -> str:
+    return pwd.getpwuid(uid).pw_name
+
+@functools.lru_cache(maxsize=4096)
+def _gid_name(gid: int) -> str:
+    return grp.getgrgid(gid).gr_name
+
+def _stat_to_permissions(stat_info: os.stat_result) -> Dict:
+    """Mode and Unix-style permission bits of a stat result, plus owner and
+    group names except on Windows"""
+    mode = stat_info.st_mode
+    permissions = {
+        'mode': mode,
+        'permissions': format(mode & 0o777, '03o')
+    }
+    if _SYSTEM != 'windows':
+        permissions['owner'] = _uid_name(stat_info.st_uid)
+        permissions['group'] = _gid_name(stat_info.st_gid)
+    return permissions
+
+# Platform path tables. They depend only on the platform, the home directory
+# and the environment at startup, so they're built once at import and the
+# getters return them as shared read-only objects
+_HOME = Path.home()
+
+if _SYSTEM == 'darwin':  # macOS
+    _system_paths = {
+        'system': Path('/System'),
+        'applications': Path('/Applications'),
+        'library': Path('/Library'),
+        'user_library': _HOME / 'Library',
+        'temp': Path('/private/tmp')
+    }
+    _CRITICAL_DIRECTORIES = (
+        Path('/System'),
+        Path('/Library'),
+        Path('/usr/local/bin'),
+        Path('/private/etc'),
+        _HOME / 'Library'
+    )
+    _STARTUP_LOCATIONS = (
+        _HOME / 'Library/LaunchAgents',
+        Path('/Library/LaunchAgents'),
+        Path('/Library/LaunchDaemons'),
+        Path('/System/Library/LaunchAgents'),
+        Path('/System/Library/LaunchDaemons')
+    )
+elif _SYSTEM == 'linux':
+    _system_paths = {
+        'root': Path('/'),
+        'bin': Path('/bin'),
+        'usr': Path('/usr'),
+        'etc': Path('/etc'),
+        'var': Path('/var'),
+        'tmp': Path('/tmp'),
+        'opt': Path('/opt')
+    }
+    _CRITICAL_DIRECTORIES = (
+        Path('/bin'),
+        Path('/sbin'),
+        Path('/usr/bin'),
+        Path('/usr/sbin'),
+        Path('/etc'),
+        Path('/lib'),
+        Path('/usr/lib')
+    )
+    _STARTUP_LOCATIONS = (
+        _HOME / '.config/autostart',
+        Path('/etc/xdg/autostart'),
+        _HOME / '.profile',
+        _HOME / '.bashrc',
+        Path('/etc/profile')
+    )
+else:  # Windows or other
+    _system_drive = Path(os.environ.get('SystemDrive', 'C:'))
+    _program_files = Path(os.environ.get('ProgramFiles', 'C:/Program Files'))
+    _system_paths = {
+        'system': _system_drive / 'Windows',
+        'program_files': _program_files,
+        'temp': Path(os.environ.get('TEMP', 'C:/Windows/Temp'))
+    }
+    _CRITICAL_DIRECTORIES = (
+        _system_drive / 'Windows',
+        _system_drive / 'Windows/System32',
+        _program_files,
+        Path(os.environ.get('ProgramData', 'C:/ProgramData'))
+    )
+    # Per-user and all-users Startup folders, where their roots are set
+    _STARTUP_LOCATIONS = tuple(
+        Path(os.environ[name]) / 'Microsoft/Windows/Start Menu/Programs/Startup'
+        for name in ('APPDATA', 'ProgramData')
+        if name in os.environ
+    )
+
+# Common paths for all platforms
+_system_paths.update({
+    'home': _HOME,
+    'documents': _HOME / 'Documents',
+    'downloads': _HOME / 'Downloads'
+})
+_SYSTEM_PATHS = MappingProxyType(_system_paths)
 
 class PlatformUtils:
     """Platform-agnostic utility functions"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.system = platform.system().lower()
+        self.system = _SYSTEM
         self.is_admin = self._check_admin_rights()
         
     def _check_admin_rights(self) -> bool:
@@ -27,130 +141,29 @@ class PlatformUtils:
             self.logger.warning(f"Could not check admin rights: {e}")
             return False
             
-    def get_system_paths(self) -> Dict[str, Path]:
-        """Get platform-specific system paths"""
-        paths = {}
-        
-        if self.system == 'darwin':  # macOS
-            paths.update({
-                'system': Path('/System'),
-                'applications': Path('/Applications'),
-                'library': Path('/Library'),
-                'user_library': Path.home() / 'Library',
-                'temp': Path('/private/tmp')
-            })
-        elif self.system == 'linux':
-            paths.update({
-                'root': Path('/'),
-                'bin': Path('/bin'),
-                'usr': Path('/usr'),
-                'etc': Path('/etc'),
-                'var': Path('/var'),
-                'tmp': Path('/tmp'),
-                'opt': Path('/opt')
-            })
-        else:  # Windows or other
-            system_drive = os.environ.get('SystemDrive', 'C:')
-            paths.update({
-                'system': Path(system_drive) / 'Windows',
-                'program_files': Path(os.environ.get('ProgramFiles', 'C:/Program Files')),
-                'temp': Path(os.environ.get('TEMP', 'C:/Windows/Temp'))
-            })
-            
-        # Common paths for all platforms
-        paths.update({
-            'home': Path.home(),
-            'documents': Path.home() / 'Documents',
-            'downloads': Path.home() / 'Downloads'
-        })
-        
-        return paths
+    def get_system_paths(self) -> Mapping[str, Path]:
+        """Get platform-specific system paths, as a shared read-only mapping"""
+        return _SYSTEM_PATHS
         
-    def get_critical_directories(self) -> List[Path]:
+    def get_critical_directories(self) -> Tuple[Path, ...]:
         """Get platform-specific critical directories to monitor"""
-        if self.system == 'darwin':  # macOS
-            return [
-                Path('/System'),
-                Path('/Library'),
-                Path('/usr/local/bin'),
-                Path('/private/etc'),
-                Path.home() / 'Library'
-            ]
-        elif self.system == 'linux':
-            return [
-                Path('/bin'),
-                Path('/sbin'),
-                Path('/usr/bin'),
-                Path('/usr/sbin'),
-                Path('/etc'),
-                Path('/lib'),
-                Path('/usr/lib')
-            ]
-        else:  # Windows
-            system_drive = os.environ.get('SystemDrive', 'C:')
-            return [
-                Path(system_drive) / 'Windows',
-                Path(system_drive) / 'Windows/System32',
-                Path(os.environ.get('ProgramFiles', 'C:/Program Files')),
-                Path(os.environ.get('ProgramData', 'C:/ProgramData'))
-            ]
-            
-    def get_startup_locations(self) -> List[Path]:
+        return _CRITICAL_DIRECTORIES
+        
+    def get_startup_locations(self) -> Tuple[Path, ...]:
         """Get platform-specific startup locations"""
-        if self.system == 'darwin':  # macOS
-            return [
-                Path.home() / 'Library/LaunchAgents',
-                Path('/Library/LaunchAgents'),
-                Path('/Library/LaunchDaemons'),
-                Path('/System/Library/LaunchAgents'),
-                Path('/System/Library/LaunchDaemons')
-            ]
-        elif self.system == 'linux':
-            return [
-                Path.home() / '.config/autostart',
-                Path('/etc/xdg/autostart'),
-                Path.home() / '.profile',
-                Path.home() / '.bashrc',
-                Path('/etc/profile')
-            ]
-        else:  # Windows
-            startup_paths = []
-            if 'APPDATA' in os.environ:
-                startup_paths.append(
-                    Path(os.environ['APPDATA']) / 'Microsoft/Windows/Start Menu/Programs/Startup'
-                )
-            if 'ProgramData' in os.environ:
-                startup_paths.append(
-                    Path(os.environ['ProgramData']) / 'Microsoft/Windows/Start Menu/Programs/Startup'
-                )
-            return startup_paths
-            
+        return _STARTUP_LOCATIONS
+        
     def scan_file(self, file_path: Path) -> Dict:
         """Platform-agnostic file scanning"""
         try:
             stat_info = file_path.stat()
-            
-            # Get Unix-style permissions for all platforms
-            mode = stat_info.st_mode
-            permissions = oct(mode)[-3:]
-            
-            # Get owner/group info
-            if self.system != 'windows':
-                import pwd
-                import grp
-                owner = pwd.getpwuid(stat_info.st_uid).pw_name
-                group = grp.getgrgid(stat_info.st_gid).gr_name
-            else:
-                owner = 'Unknown'
-                group = 'Unknown'
-                
             return {
                 'path': str(file_path),
                 'size': stat_info.st_size,
-                'mode': mode,
-                'permissions': permissions,
-                'owner': owner,
-                'group': group,
+                # Owner and group are only known outside Windows
+                'owner': 'Unknown',
+                'group': 'Unknown',
+                **_stat_to_permissions(stat_info),
                 'platform': self.system
             }
             
@@ -160,4 +173,35 @@ class PlatformUtils:
                 'path': str(file_path),
                 'error': str(e),
                 'platform': self.system
-            }
\ No newline at end of file
+            }
+            
+    def scan_dir(self, dir_path: Path) -> Iterator[Dict]:
+        """Scan each entry of a directory, as scan_file would
+        
+        Entries come from one os.scandir pass and are stat'ed through their
+        DirEntry, which on Windows reuses the data read with the directory,
+        so no Path is built per entry.
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        stat_info = entry.stat()
+                        yield {
+                            'path': entry.path,
+                            'size': stat_info.st_size,
+                            # Owner and group are only known outside Windows
+                            'owner': 'Unknown',
+                            'group': 'Unknown',
+                            **_stat_to_permissions(stat_info),
+                            'platform': self.system
+                        }
+                    except Exception as e:
+                        self.logger.error(f"Error scanning file {entry.path}: {e}")
+                        yield {
+                            'path': entry.path,
+                            'error': str(e),
+                            'platform': self.system
+                        }
+        except OSError as e:
+            self.logger.error(f"Error scanning directory {dir_path}: {e}")
\ No newline at end of file
@@ -79,6 +79,7 @@ class SystemHealthMonitor:
         if self.monitor_thread:
             self.monitor_thread.join()
             self.logger.info("System health monitoring stopped")
+        self.alert_manager.shutdown()
             
     def _monitor_loop(self):
         """Main monitoring loop"""
@@ -283,6 +283,8 @@ class MainWindow(QMainWindow):
             if self.engine:
                 if hasattr(self.engine, 'system_monitor'):
                     self.engine.system_monitor.stop_monitoring()
+                if hasattr(self.engine, 'shutdown'):
+                    self.engine.shutdown()
                     
             # Force garbage collection
             gc.collect()
@@ -73,6 +73,26 @@ def get_platform_scripts():
     
     return scripts.get(system, [])
 
+def get_ext_modules():
+    """Get modules compiled with mypyc
+    
+    The performance monitor samples every second for the life of the process,
+    so its own overhead shows up in the CPU usage it reports. Set
+    ANTIVIRUS_MYPYC=1 to compile it; without mypyc it stays pure Python.
+    """
+    if os.environ.get('ANTIVIRUS_MYPYC') != '1':
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc not installed, building without compiled modules", file=sys.stderr)
+        return []
+        
+    return mypycify([
+        '--ignore-missing-imports',
+        'core/performance_monitor.py',
+    ])
+
 setup(
     name='AntiVirusLite',
     version='0.1.0',
@@ -83,6 +103,7 @@ setup(
     install_requires=get_platform_requirements(),
     data_files=get_platform_data_files(),
     scripts=get_platform_scripts(),
+    ext_modules=get_ext_modules(),
     entry_points={
         'console_scripts': [
             'antivirus=src.main:main',